@@ -2,15 +2,33 @@
 
 from __future__ import annotations
 
+import functools
 import re
-from dataclasses import dataclass
-from typing import Protocol, runtime_checkable
+import threading
+from array import array
+from collections.abc import Callable, Collection, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple, Protocol, runtime_checkable
 
 from arcllm.exceptions import ArcLLMConfigError
 
+try:
+    import re2 as _re2
+except ImportError:  # Optional: pip install arcllm[re2]
+    _re2 = None
 
-@dataclass(frozen=True, eq=True)
-class PiiMatch:
+try:
+    import regex as _regex
+except ImportError:  # Optional: pip install arcllm[regex]
+    _regex = None
+
+try:
+    import hyperscan as _hyperscan
+except ImportError:  # Optional: pip install arcllm[fast-pii]
+    _hyperscan = None
+
+
+class PiiMatch(NamedTuple):
     """A single PII detection result."""
 
     pii_type: str
@@ -19,6 +37,32 @@ class PiiMatch:
     matched_text: str
 
 
+@dataclass
+class PiiMatches:
+    """Column-oriented PII detection results.
+
+    Holds one entry per match across parallel columns; offsets are packed
+    into ``array`` buffers instead of one tuple of boxed ints per match,
+    which keeps long scans (logs, transcripts) light on allocations.
+    """
+
+    text: str
+    pii_types: list[str] = field(default_factory=list)
+    starts: array[int] = field(default_factory=lambda: array("q"))
+    ends: array[int] = field(default_factory=lambda: array("q"))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def to_list(self) -> list[PiiMatch]:
+        """Materialise the results as ``PiiMatch`` tuples."""
+        text = self.text
+        return [
+            PiiMatch(pii_type, start, end, text[start:end])
+            for pii_type, start, end in zip(self.pii_types, self.starts, self.ends)
+        ]
+
+
 @runtime_checkable
 class PiiDetector(Protocol):
     """Protocol for PII detection backends."""
@@ -30,97 +74,592 @@ class PiiDetector(Protocol):
 # Built-in regex patterns
 # ---------------------------------------------------------------------------
 
-_BUILTIN_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
-    ("SSN", re.compile(r"\b\d{3}-\d{2}-\d{4}\b")),
+# PII formats are ASCII: digits are spelled [0-9] rather than \d so no
+# pattern pays for (or matches) Unicode decimal digits. Written as explicit
+# classes instead of re.ASCII so the same sources compile under RE2.
+# Separators spell out the ASCII whitespace that str \s matches; RE2's \s
+# omits \v and bytes \s omits \x1c-\x1f, so \s would differ by engine.
+_SEP = r"\t\n\v\f\r\x1c-\x1f "
+
+_BUILTIN_PATTERNS: list[tuple[str, str]] = [
+    ("SSN", r"\b[0-9]{3}-[0-9]{2}-[0-9]{4}\b"),
     (
         "CREDIT_CARD",
-        re.compile(r"\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b"),
-    ),
-    (
-        "EMAIL",
-        re.compile(r"\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b"),
+        rf"\b[0-9]{{4}}[{_SEP}-]?[0-9]{{4}}[{_SEP}-]?[0-9]{{4}}[{_SEP}-]?[0-9]{{4}}\b",
     ),
+    ("EMAIL", r"\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b"),
     (
         "PHONE",
-        re.compile(
-            r"\b(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b"
-        ),
+        rf"\b(?:\+?1[-.{_SEP}]?)?\(?[0-9]{{3}}\)?[-.{_SEP}]?[0-9]{{3}}[-.{_SEP}]?[0-9]{{4}}\b",
     ),
-    ("IPV4", re.compile(r"\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b")),
+    ("IPV4", r"\b[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\b"),
 ]
 
 
+# Every built-in match contains an ASCII digit or "@", so text holding none
+# of these cannot contain built-in PII.
+_BUILTIN_TRIGGERS: tuple[str, ...] = tuple("0123456789@")
+
+
+# Shortest text any built-in pattern can match ("a@b.cc"); shorter strings
+# skip the scan entirely.
+_BUILTIN_MIN_LEN = 6
+
+
+def _has_builtin_trigger(text: str) -> bool:
+    """Return True when *text* contains a digit or ``@``.
+
+    A few substring searches run at memchr speed and beat encoding the text
+    for ``bytes.translate``, so PII-free prose skips the regex scan cheaply.
+    """
+    for char in _BUILTIN_TRIGGERS:
+        if char in text:
+            return True
+    return False
+
+
+# Luhn tables for bytes.translate: every non-digit byte is deleted, and each
+# digit byte maps to the value it contributes when doubled.
+_NON_DIGIT_BYTES = bytes(b for b in range(256) if not 0x30 <= b <= 0x39)
+_LUHN_DOUBLED = bytes(
+    (2 * (b - 0x30) if b < 0x35 else 2 * (b - 0x30) - 9) if 0x30 <= b <= 0x39 else 0
+    for b in range(256)
+)
+
+
+def _luhn_valid(candidate: str | bytes) -> bool:
+    """Return True when the digits in *candidate* pass the Luhn checksum.
+
+    Separators are stripped and doubled digits mapped with ``bytes.translate``
+    so the checksum is two C-level sums rather than a per-digit Python loop.
+    """
+    if isinstance(candidate, str):
+        # Pattern digits are ASCII; anything else is a separator.
+        candidate = candidate.encode("ascii", "ignore")
+    digits = candidate.translate(None, _NON_DIGIT_BYTES)
+    undoubled = digits[::-2]
+    total = (
+        sum(undoubled)
+        - 0x30 * len(undoubled)
+        + sum(digits[-2::-2].translate(_LUHN_DOUBLED))
+    )
+    return total % 10 == 0
+
+
+# Post-match checks by PII type; a candidate that fails is treated as if
+# that pattern had not matched.
+_VALIDATORS: dict[str, Callable[[str | bytes], bool]] = {
+    "CREDIT_CARD": _luhn_valid,
+}
+
+
+class _CompiledPatterns:
+    """One engine's compiled form of a pattern list.
+
+    ``combined`` fuses every pattern into one alternation with a positional
+    named group per pattern (``_p0``, ``_p1``, ...) so arbitrary PII type
+    names never have to be valid identifiers. ``patterns`` holds each
+    pattern compiled on its own for the anchored longest-match check.
+    Group numbers shift once the patterns are combined, so custom patterns
+    with numbered group references are rejected by ``_compile_checked``.
+
+    ``search`` and ``matchers`` are the bound scan entry points; with a
+    *timeout* (``regex`` engine only) every call carries it. *as_bytes*
+    compiles ASCII *sources* as bytes patterns.
+    """
+
+    def __init__(
+        self,
+        engine: Any,
+        sources: list[str],
+        timeout: float | None = None,
+        as_bytes: bool = False,
+        **options: Any,
+    ) -> None:
+        combined = "|".join(
+            f"(?P<_p{i}>{pattern})" for i, pattern in enumerate(sources)
+        )
+        if as_bytes:
+            self.combined = engine.compile(combined.encode("ascii"), **options)
+            self.patterns = [
+                engine.compile(pattern.encode("ascii"), **options)
+                for pattern in sources
+            ]
+        else:
+            self.combined = engine.compile(combined, **options)
+            self.patterns = [
+                engine.compile(pattern, **options) for pattern in sources
+            ]
+        if timeout is None:
+            self.search = self.combined.search
+            self.matchers = [pattern.match for pattern in self.patterns]
+        else:
+            self.search = functools.partial(self.combined.search, timeout=timeout)
+            self.matchers = [
+                functools.partial(pattern.match, timeout=timeout)
+                for pattern in self.patterns
+            ]
+        # Outer group number -> pattern index (custom patterns may nest groups,
+        # named or not, so only the positional wrapper groups are mapped)
+        self.pattern_for_group: dict[int, int] = {
+            self.combined.groupindex[f"_p{i}"]: i for i in range(len(sources))
+        }
+
+
+def _compile_re2(sources: list[str]) -> _CompiledPatterns | None:
+    """Compile with RE2 when installed and every pattern is RE2-compatible.
+
+    RE2 matches in linear time but rejects lookarounds and backreferences;
+    custom patterns using those keep the detector on stdlib ``re``.
+    """
+    if _re2 is None:
+        return None
+    options = _re2.Options()
+    options.log_errors = False
+    try:
+        return _CompiledPatterns(_re2, sources, options=options)
+    except _re2.error:
+        return None
+
+
+def _compile_ascii_bytes(
+    engine: Any, sources: list[str], timeout: float | None
+) -> _CompiledPatterns | None:
+    """Compile the backtracking set as bytes patterns for ASCII text.
+
+    Bytes patterns skip the Unicode character-class lookups that str
+    patterns pay on every ``\\b``/``\\s``/``\\w``, so ASCII text scans
+    noticeably faster. The built-ins spell their separators as an explicit
+    class, so they agree on ASCII input; in custom patterns bytes ``\\s``
+    excludes the ``\\x1c``-``\\x1f`` separators that str ``\\s`` matches.
+    Returns None for non-ASCII or str-only pattern syntax.
+    """
+    if not all(pattern.isascii() for pattern in sources):
+        return None
+    try:
+        return _CompiledPatterns(engine, sources, timeout=timeout, as_bytes=True)
+    except engine.error:
+        return None
+
+
+# Leading global inline flags such as "(?i)"; Python only accepts them at
+# the very start of an expression.
+_GLOBAL_FLAGS = re.compile(r"\(\?([aiLmsux]+)\)")
+
+
+def _scope_inline_flags(pattern: str) -> str:
+    """Rewrite leading global flags, ``(?i)x``, as the scoped ``(?i:x)``.
+
+    Wrapped in the combined alternation, global flags would no longer lead
+    the expression and fail to compile; the scoped form means the same.
+    """
+    flags = ""
+    pos = 0
+    while m := _GLOBAL_FLAGS.match(pattern, pos):
+        flags += m.group(1)
+        pos = m.end()
+    if not flags:
+        return pattern
+    body = pattern[pos:]
+    if "x" in flags:
+        body += "\n"  # Verbose: a trailing comment must not eat the ")"
+    return f"(?{''.join(dict.fromkeys(flags))}:{body})"
+
+
+_OCTAL_ESCAPE = re.compile(r"[0-7]{3}")
+
+
+def _has_numbered_group_ref(pattern: str) -> bool:
+    """Return True if *pattern* refers to a group by number.
+
+    Covers ``\\1``-style backreferences and ``(?(1)...)`` conditionals
+    outside character classes; ``\\0`` and three-digit octal escapes are
+    not references.
+    """
+    i = 0
+    in_class = False
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            digit = pattern[i + 1 : i + 2]
+            if (
+                not in_class
+                and digit
+                and digit in "123456789"
+                and not _OCTAL_ESCAPE.match(pattern, i + 1)
+            ):
+                return True
+            i += 2
+            continue
+        if in_class:
+            if char == "]":
+                in_class = False
+        elif char == "[":
+            in_class = True
+            # A "]" right after "[" or "[^" is a literal, not the class end
+            if pattern[i + 1 : i + 2] == "^":
+                i += 1
+            if pattern[i + 1 : i + 2] == "]":
+                i += 1
+        elif pattern.startswith("(?(", i) and pattern[i + 3 : i + 4].isdigit():
+            return True
+        i += 1
+    return False
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_checked(name: str, pattern: str) -> re.Pattern[str]:
+    """Compile one pattern, raising ArcLLMConfigError if it is invalid.
+
+    Patterns referring to groups by number are rejected: the combined
+    alternation renumbers groups, so the reference would silently point
+    elsewhere. Cached per pattern so pattern lists that share entries (the
+    built-ins, common custom patterns) validate each one only once.
+    """
+    try:
+        compiled = re.compile(pattern)
+    except re.error as e:
+        raise ArcLLMConfigError(f"Invalid regex for custom PII pattern '{name}': {e}")
+    if _has_numbered_group_ref(pattern):
+        raise ArcLLMConfigError(
+            f"Custom PII pattern '{name}' refers to a group by number; "
+            "use a named group instead, e.g. (?P<d>[0-9])(?P=d)"
+        )
+    return compiled
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_sources(
+    sources: tuple[tuple[str, str], ...],
+    match_timeout: float | None = None,
+) -> tuple[_CompiledPatterns, _CompiledPatterns | None, _CompiledPatterns | None]:
+    """Compile a (name, pattern) list once per process.
+
+    Compiled pattern objects are immutable and safe to share across
+    detectors and threads, so every detector with the same pattern list
+    reuses one set. Invalid patterns raise and are not cached. With a
+    *match_timeout* the backtracking sets are built on the ``regex`` engine
+    so each search is time-bounded.
+
+    Returns the str set, its bytes twin for ASCII text (when the patterns
+    allow it) and the RE2 set (when installed and compatible).
+    """
+    for name, pattern in sources:
+        _compile_checked(name, pattern)
+    pattern_sources = [_scope_inline_flags(pattern) for _, pattern in sources]
+    engine = re if match_timeout is None else _regex
+    try:
+        std = _CompiledPatterns(engine, pattern_sources, timeout=match_timeout)
+    except engine.error as e:
+        # e.g. two custom patterns defining the same group name
+        raise ArcLLMConfigError(f"Custom PII patterns cannot be combined: {e}")
+    return (
+        std,
+        _compile_ascii_bytes(engine, pattern_sources, match_timeout),
+        _compile_re2(pattern_sources),
+    )
+
+
 class RegexPiiDetector:
     """PII detector using compiled regex patterns.
 
     Ships with built-in patterns for SSN, credit card, email, phone, and IPv4.
     Accepts additional custom patterns via constructor.
+
+    All patterns are fused into a single alternation so the text is scanned
+    once, regardless of how many patterns are configured. When
+    ``google-re2`` is installed, ASCII text is scanned with RE2's DFA
+    instead of the backtracking stdlib engine. Compiled patterns are cached
+    per pattern list, so constructing a detector does not recompile.
+
+    RE2 runs in linear time, but text it cannot take (non-ASCII, or custom
+    patterns with lookarounds/backreferences) is matched by a backtracking
+    engine. *match_timeout* (seconds, requires ``pip install arcllm[regex]``)
+    bounds each search there, so a catastrophically backtracking custom
+    pattern raises ``ArcLLMConfigError`` instead of stalling the pipeline.
     """
 
     def __init__(
         self,
         custom_patterns: list[dict[str, str]] | None = None,
+        match_timeout: float | None = None,
     ) -> None:
-        self._patterns: list[tuple[str, re.Pattern[str]]] = list(_BUILTIN_PATTERNS)
+        if match_timeout is not None:
+            if match_timeout <= 0:
+                raise ArcLLMConfigError("pii_match_timeout must be > 0")
+            if _regex is None:
+                raise ArcLLMConfigError(
+                    "pii_match_timeout requires arcllm[regex] "
+                    "(pip install arcllm[regex])"
+                )
+        self._match_timeout = match_timeout
+        sources = list(_BUILTIN_PATTERNS)
         if custom_patterns:
-            for entry in custom_patterns:
-                name = entry["name"]
-                try:
-                    compiled = re.compile(entry["pattern"])
-                except re.error as e:
-                    raise ArcLLMConfigError(
-                        f"Invalid regex for custom PII pattern '{name}': {e}"
-                    )
-                self._patterns.append((name, compiled))
-
-    def detect(self, text: str) -> list[PiiMatch]:
+            sources.extend(
+                (entry["name"], entry["pattern"]) for entry in custom_patterns
+            )
+        self._sources: tuple[tuple[str, str], ...] = tuple(sources)
+        self._types: list[str] = [name for name, _ in sources]
+        # Custom patterns may match text with no digit or "@", or very short text
+        self._builtin_only = not custom_patterns
+        self._min_len = _BUILTIN_MIN_LEN if self._builtin_only else 1
+        self._std, self._std_bytes, self._re2 = _compile_sources(
+            self._sources, match_timeout
+        )
+
+    def detect(
+        self, text: str, types: Collection[str] | None = None
+    ) -> list[PiiMatch]:
         """Scan text for PII patterns.
 
         Returns non-overlapping matches sorted by start position.
         When matches overlap, the longer match takes priority.
+        *types* limits the scan to those PII types: only their patterns are
+        compiled into the alternation (cached per subset), so excluded
+        types cost nothing. Unknown type names are ignored.
         """
-        if not text:
-            return []
-
-        all_matches: list[PiiMatch] = []
-        for pii_type, pattern in self._patterns:
-            for m in pattern.finditer(text):
-                all_matches.append(
-                    PiiMatch(
-                        pii_type=pii_type,
-                        start=m.start(),
-                        end=m.end(),
-                        matched_text=m.group(),
-                    )
-                )
+        return [
+            PiiMatch(pii_type, start, end, text[start:end])
+            for pii_type, start, end in self._spans(text, types)
+        ]
+
+    def detect_many(self, texts: Sequence[str]) -> list[list[PiiMatch]]:
+        """Scan several texts, returning one ``detect`` result per text.
+
+        With only the built-in patterns the texts are joined with ``"\\x00"``
+        and scanned in one pass; no built-in pattern can match or straddle
+        that separator, and it is a non-word character, so ``\\b`` behaves
+        as at a string edge. Custom patterns might match it, so detectors
+        with custom patterns scan each text separately.
+        """
+        if len(self._types) > len(_BUILTIN_PATTERNS) or len(texts) < 2:
+            return [self.detect(text) for text in texts]
+
+        joined = "\x00".join(texts)
+        results: list[list[PiiMatch]] = [[] for _ in texts]
+        i = 0
+        offset = 0
+        limit = len(texts[0])  # End of text i within joined
+        for pii_type, start, end in self._spans(joined):
+            while start > limit:
+                i += 1
+                offset = limit + 1
+                limit = offset + len(texts[i])
+            results[i].append(
+                PiiMatch(pii_type, start - offset, end - offset, joined[start:end])
+            )
+        return results
+
+    def detect_bulk(
+        self, text: str, types: Collection[str] | None = None
+    ) -> PiiMatches:
+        """Scan text like ``detect`` but return column-oriented results."""
+        result = PiiMatches(text)
+        append_type = result.pii_types.append
+        append_start = result.starts.append
+        append_end = result.ends.append
+        for pii_type, start, end in self._spans(text, types):
+            append_type(pii_type)
+            append_start(start)
+            append_end(end)
+        return result
+
+    def _spans(
+        self, text: str, types: Collection[str] | None = None
+    ) -> Iterator[tuple[str, int, int]]:
+        """Yield ``(pii_type, start, end)`` for each match in *text*."""
+        if len(text) < self._min_len or not self._may_match(text):
+            return iter(())
+        if types is None:
+            names = self._types
+            std, std_bytes, re2 = self._std, self._std_bytes, self._re2
+        else:
+            sources = tuple(src for src in self._sources if src[0] in types)
+            if not sources:
+                return iter(())
+            names = [name for name, _ in sources]
+            std, std_bytes, re2 = _compile_sources(sources, self._match_timeout)
+        # ASCII text is scanned as bytes: encoded once, offsets identical to
+        # the str offsets. RE2 (linear time) is preferred when available;
+        # its str API would re-encode the whole text on every call.
+        if text.isascii():
+            ascii_set = re2 if re2 is not None else std_bytes
+            if ascii_set is not None:
+                return self._scan(ascii_set, names, text.encode("ascii"))
+        return self._scan(std, names, text)
+
+    def _may_match(self, text: str) -> bool:
+        """Cheap prefilter: False only when *text* cannot contain a match."""
+        return not self._builtin_only or _has_builtin_trigger(text)
 
-        if not all_matches:
-            return []
+    @staticmethod
+    def _scan(
+        compiled: _CompiledPatterns, names: list[str], haystack: str | bytes
+    ) -> Iterator[tuple[str, int, int]]:
+        """Walk *haystack* with the combined pattern, resolving overlaps."""
+        search = compiled.search
+        matchers = compiled.matchers
+        pattern_for_group = compiled.pattern_for_group
+        validators = [_VALIDATORS.get(name) for name in names]
+        pos = 0
+        try:
+            while (m := search(haystack, pos)) is not None:
+                start = m.start()
+                first = pattern_for_group[m.lastindex]
+                # The alternation picks the first pattern that matches here;
+                # a longer match from a later pattern at the same start wins,
+                # and candidates failing their validator are dropped.
+                index, end = -1, start
+                for i in range(first, len(matchers)):
+                    if i == first:
+                        candidate_end = m.end()
+                    else:
+                        other = matchers[i](haystack, start)
+                        if other is None:
+                            continue
+                        candidate_end = other.end()
+                    if candidate_end <= end:
+                        continue
+                    validate = validators[i]
+                    if validate is None or validate(haystack[start:candidate_end]):
+                        index, end = i, candidate_end
+                if index < 0:
+                    # Zero-width or rejected candidates only — move on
+                    pos = start + 1
+                    continue
+                yield names[index], start, end
+                pos = end
+        except TimeoutError:
+            raise ArcLLMConfigError(
+                "PII scan exceeded pii_match_timeout; a custom pattern is "
+                "backtracking excessively on this input"
+            )
 
-        # Sort by start position, then by length descending (longer wins)
-        all_matches.sort(key=lambda m: (m.start, -(m.end - m.start)))
+    def redact(self, text: str, types: Collection[str] | None = None) -> str:
+        """Return *text* with every detected PII span replaced by ``[PII:TYPE]``.
 
-        # Remove overlapping matches (keep first = longest at each position)
-        filtered: list[PiiMatch] = []
-        last_end = -1
-        for match in all_matches:
-            if match.start >= last_end:
-                filtered.append(match)
-                last_end = match.end
+        Builds the result straight from the scan in one pass: spans arrive
+        in start order, so no ``PiiMatch`` list is built or sorted. Text
+        without PII is returned unchanged (the same object).
+        """
+        parts: list[str] = []
+        last = 0
+        for pii_type, start, end in self._spans(text, types):
+            parts.append(text[last:start])
+            parts.append(f"[PII:{pii_type}]")
+            last = end
+        if not parts:
+            return text
+        parts.append(text[last:])
+        return "".join(parts)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_hyperscan(
+    sources: tuple[tuple[str, str], ...],
+) -> tuple[Any, threading.Lock] | None:
+    """Compile a (name, pattern) list into one Hyperscan block database.
+
+    Returns None when any pattern uses syntax Hyperscan rejects (lookarounds,
+    backreferences, patterns that can match empty). The lock serialises
+    scans because a database owns a single scratch space.
+    """
+    db = _hyperscan.Database(mode=_hyperscan.HS_MODE_BLOCK)
+    try:
+        db.compile(
+            expressions=[pattern.encode() for _, pattern in sources],
+            ids=list(range(len(sources))),
+        )
+    except _hyperscan.error:
+        return None
+    return db, threading.Lock()
+
+
+def _stop_scan(*_args: Any) -> bool:
+    """Hyperscan match handler that halts the scan on the first match."""
+    return True
+
+
+class HyperscanPiiDetector(RegexPiiDetector):
+    """PII detector that prefilters text with a Hyperscan database.
+
+    Hyperscan compiles every pattern into one vectorised automaton and
+    checks the whole text in a single native pass, stopping at the first
+    hit. Text with no candidate match — the common case — never reaches the
+    regex engine; text with a hit is scanned by the inherited regex path, so
+    results are identical to ``RegexPiiDetector``. Non-ASCII text, and
+    pattern lists Hyperscan cannot compile, always use the regex path.
+
+    Requires ``pip install arcllm[fast-pii]``.
+    """
+
+    def __init__(
+        self,
+        custom_patterns: list[dict[str, str]] | None = None,
+        match_timeout: float | None = None,
+    ) -> None:
+        if _hyperscan is None:
+            raise ArcLLMConfigError(
+                "pii_detector='hyperscan' requires arcllm[fast-pii] "
+                "(pip install arcllm[fast-pii])"
+            )
+        super().__init__(custom_patterns=custom_patterns, match_timeout=match_timeout)
+        self._hs = _compile_hyperscan(self._sources)
 
-        return filtered
+    def _may_match(self, text: str) -> bool:
+        """Skip the regex scan when Hyperscan finds no candidate match."""
+        if not super()._may_match(text):
+            return False
+        if self._hs is None or not text.isascii():
+            return True
+        db, lock = self._hs
+        try:
+            with lock:
+                db.scan(text.encode("ascii"), match_event_handler=_stop_scan)
+        except _hyperscan.ScanTerminated:
+            return True  # At least one candidate — confirm with the regex scan
+        return False
+
+
+@functools.cache
+def default_detector() -> RegexPiiDetector:
+    """Return the shared detector with built-in patterns only."""
+    return RegexPiiDetector()
 
 
 def redact_text(text: str, matches: list[PiiMatch]) -> str:
     """Replace PII matches with [PII:TYPE] placeholders.
 
-    Processes matches in reverse order to preserve string indices.
+    Builds the result in a single pass over the matches (sorted by start),
+    so the cost is linear in the text length rather than per match.
+    """
+    if not matches:
+        return text
+
+    parts: list[str] = []
+    last = 0
+    for match in sorted(matches, key=lambda m: m.start):
+        parts.append(text[last : match.start])
+        parts.append(f"[PII:{match.pii_type}]")
+        last = match.end
+    parts.append(text[last:])
+    return "".join(parts)
+
+
+def redact_text_bulk(text: str, matches: PiiMatches) -> str:
+    """Replace column-oriented PII matches with [PII:TYPE] placeholders.
+
+    ``matches`` must come from ``detect_bulk`` on the same *text*, so the
+    entries are already ordered by start position.
     """
     if not matches:
         return text
 
-    # Process in reverse order so earlier replacements don't shift indices
-    result = text
-    for match in reversed(matches):
-        result = result[: match.start] + f"[PII:{match.pii_type}]" + result[match.end :]
-    return result
+    parts: list[str] = []
+    last = 0
+    for pii_type, start, end in zip(matches.pii_types, matches.starts, matches.ends):
+        parts.append(text[last:start])
+        parts.append(f"[PII:{pii_type}]")
+        last = end
+    parts.append(text[last:])
+    return "".join(parts)
@@ -6,6 +6,9 @@ import hashlib
 import hmac
 import json
 import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
 from typing import Any, Protocol
 
 from arcllm.exceptions import ArcLLMConfigError
@@ -17,16 +20,89 @@ class RequestSigner(Protocol):
 
     def sign(self, payload: bytes) -> str: ...
 
+    def sign_batch(self, payloads: Iterable[bytes]) -> list[str]: ...
+
+
+# SHA-256 block size and the RFC 2104 inner/outer pad bytes.
+_SHA256_BLOCK = 64
+_IPAD = bytes.maketrans(bytes(range(256)), bytes(b ^ 0x36 for b in range(256)))
+_OPAD = bytes.maketrans(bytes(range(256)), bytes(b ^ 0x5C for b in range(256)))
+
+
+# Shared canonical encoder: json.dumps with non-default options builds a
+# new JSONEncoder on every call.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
 
 class HmacSigner:
-    """HMAC-SHA256 request signer using stdlib."""
+    """HMAC-SHA256 request signer using stdlib.
+
+    The key-dependent inner and outer SHA-256 states are computed once; each
+    ``sign()`` copies them and hashes only the payload, skipping the per-call
+    key setup of ``hmac.new``. Output is identical to ``hmac.new``.
+    """
 
     def __init__(self, key: bytes) -> None:
-        self._key = key
+        if len(key) > _SHA256_BLOCK:
+            key = hashlib.sha256(key).digest()
+        key = key.ljust(_SHA256_BLOCK, b"\x00")
+        self._inner = hashlib.sha256(key.translate(_IPAD))
+        self._outer = hashlib.sha256(key.translate(_OPAD))
+
+    def _finalize(self, payload: bytes) -> Any:
+        """Return the finished outer SHA-256 state for *payload*."""
+        inner = self._inner.copy()
+        inner.update(payload)
+        outer = self._outer.copy()
+        outer.update(inner.digest())
+        return outer
 
     def sign(self, payload: bytes) -> str:
         """Return hex-encoded HMAC-SHA256 signature."""
-        return hmac.new(self._key, payload, hashlib.sha256).hexdigest()
+        return self.sign_bytes(payload).hex()
+
+    def sign_bytes(self, payload: bytes) -> bytes:
+        """Return the raw 32-byte HMAC-SHA256 digest."""
+        return self._finalize(payload).digest()
+
+    def verify(self, payload: bytes, signature: str) -> bool:
+        """Return True when *signature* is the hex HMAC of *payload*.
+
+        Compares raw digests with ``hmac.compare_digest`` so the check is
+        constant-time; malformed hex is simply a mismatch.
+        """
+        try:
+            expected = bytes.fromhex(signature)
+        except ValueError:
+            return False
+        return hmac.compare_digest(self.sign_bytes(payload), expected)
+
+    def sign_batch(self, payloads: Iterable[bytes]) -> list[str]:
+        """Return one hex-encoded signature per payload, in order.
+
+        Shares the precomputed pad states across the whole batch (fan-out
+        to several providers, retried requests).
+        """
+        finalize = self._finalize
+        return [finalize(payload).digest().hex() for payload in payloads]
+
+
+def _message_data(message: Message) -> dict[str, Any]:
+    """Return ``message.model_dump()``, built directly for plain text messages."""
+    if type(message) is Message and isinstance(message.content, str):
+        return {"role": message.role, "content": message.content}
+    return message.model_dump()
+
+
+def _tool_data(tool: Tool) -> dict[str, Any]:
+    """Return ``tool.model_dump()`` without copying the parameter schema."""
+    if type(tool) is Tool:
+        return {
+            "name": tool.name,
+            "description": tool.description,
+            "parameters": tool.parameters,
+        }
+    return tool.model_dump()
 
 
 def canonical_payload(
@@ -36,19 +112,57 @@ def canonical_payload(
 ) -> bytes:
     """Serialize request content to deterministic canonical JSON bytes.
 
-    Uses sorted keys and compact separators for determinism.
+    Uses sorted keys and compact separators for determinism. The bytes are
+    the signed form, so they come from the stdlib encoder everywhere: a
+    faster third-party serializer would format some floats and non-ASCII
+    text differently and break verification across environments.
     """
     data: dict[str, Any] = {
-        "messages": [m.model_dump() for m in messages],
+        "messages": [_message_data(m) for m in messages],
         "model": model,
-        "tools": [t.model_dump() for t in tools] if tools else [],
+        "tools": [_tool_data(t) for t in tools] if tools else [],
     }
-    return json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return _CANONICAL_ENCODER.encode(data).encode("utf-8")
+
+
+# Shared HMAC signers, keyed by the SHA-256 of the key so raw secrets are
+# never cache keys. A cached signer's precomputed HMAC state can sign for
+# its key, so it is as sensitive as the key itself: retired keys are kept
+# only until evicted (least recently used first, at most this many are
+# kept) or until clear_signer_cache() runs. The lock covers lookups made
+# from asyncio.to_thread workers.
+_HMAC_SIGNER_CACHE_SIZE = 16
+_hmac_signers: OrderedDict[bytes, HmacSigner] = OrderedDict()
+_hmac_signers_lock = threading.Lock()
+
+
+def _shared_hmac_signer(key: bytes) -> HmacSigner:
+    """Return one HmacSigner per key; signers hold no per-call state."""
+    fingerprint = hashlib.sha256(key).digest()
+    with _hmac_signers_lock:
+        signer = _hmac_signers.get(fingerprint)
+        if signer is not None:
+            _hmac_signers.move_to_end(fingerprint)
+            return signer
+        signer = _hmac_signers[fingerprint] = HmacSigner(key=key)
+        if len(_hmac_signers) > _HMAC_SIGNER_CACHE_SIZE:
+            _hmac_signers.popitem(last=False)
+    return signer
+
+
+def clear_signer_cache() -> None:
+    """Drop all shared HMAC signers (e.g. after rotating the signing key)."""
+    with _hmac_signers_lock:
+        _hmac_signers.clear()
 
 
 def create_signer(algorithm: str, signing_key_env: str) -> RequestSigner:
     """Factory: create signer from algorithm name and env var.
 
+    HMAC signers are shared per key, so modules rebuilt with the same key
+    reuse one precomputed signer. Rotating the env var yields a new one;
+    call ``arcllm.clear_cache()`` afterwards to drop the retired signer.
+
     Raises:
         ArcLLMConfigError: On missing env var, unsupported algorithm,
             or missing optional dependency.
@@ -60,7 +174,7 @@ def create_signer(algorithm: str, signing_key_env: str) -> RequestSigner:
         )
 
     if algorithm == "hmac-sha256":
-        return HmacSigner(key=key_value.encode("utf-8"))
+        return _shared_hmac_signer(key_value.encode("utf-8"))
 
     if algorithm == "ecdsa-p256":
         try:
@@ -1 +1,33 @@
 """ArcLLM provider adapters."""
+
+import importlib
+
+# Adapter classes are resolved on first attribute access so that
+# `from arcllm.adapters import OpenaiAdapter` loads only that adapter
+# module (and its dependencies), not every provider.
+_LAZY_IMPORTS: dict[str, str] = {
+    "AnthropicAdapter": "arcllm.adapters.anthropic",
+    "BaseAdapter": "arcllm.adapters.base",
+    "DeepseekAdapter": "arcllm.adapters.deepseek",
+    "FireworksAdapter": "arcllm.adapters.fireworks",
+    "GroqAdapter": "arcllm.adapters.groq",
+    "HuggingfaceAdapter": "arcllm.adapters.huggingface",
+    "Huggingface_TgiAdapter": "arcllm.adapters.huggingface_tgi",
+    "MistralAdapter": "arcllm.adapters.mistral",
+    "OllamaAdapter": "arcllm.adapters.ollama",
+    "OpenaiAdapter": "arcllm.adapters.openai",
+    "TogetherAdapter": "arcllm.adapters.together",
+    "VllmAdapter": "arcllm.adapters.vllm",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name])
+        attr = getattr(module, name)
+        globals()[name] = attr  # cache for subsequent accesses
+        return attr
+    raise AttributeError(f"module 'arcllm.adapters' has no attribute {name!r}")
+
+
+__all__ = list(_LAZY_IMPORTS)
@@ -1,6 +1,8 @@
 """ArcLLM config loading — TOML-based, validated on load."""
 
-import re
+import functools
+import hashlib
+import os
 import tomllib
 from pathlib import Path
 from typing import Any
@@ -9,8 +11,6 @@ from pydantic import BaseModel, ConfigDict, ValidationError, field_validator
 
 from arcllm.exceptions import ArcLLMConfigError
 
-_PROVIDER_NAME_RE = re.compile(r"^[a-z][a-z0-9_]*$")
-
 
 # ---------------------------------------------------------------------------
 # Config models
@@ -126,6 +126,85 @@ def _load_toml_file(path: Path, context: str) -> dict[str, Any]:
         raise ArcLLMConfigError(f"Failed to parse {context}: {e}")
 
 
+def _config_cache_dir() -> Path | None:
+    """Return the parsed-config cache directory, or None when disabled.
+
+    Set ``ARCLLM_DISABLE_CONFIG_CACHE=1`` to always parse the TOML files.
+    """
+    if os.environ.get("ARCLLM_DISABLE_CONFIG_CACHE"):
+        return None
+    base = os.environ.get("XDG_CACHE_HOME")
+    if not base:
+        try:
+            base = Path.home() / ".cache"
+        except (RuntimeError, KeyError):
+            return None  # No home directory (e.g. arbitrary container UID)
+    return Path(base) / "arcllm"
+
+
+@functools.cache
+def _config_schema_tag() -> str:
+    """Short hash of the cached models' fields, annotations and defaults.
+
+    Part of every cache key, so entries written by an arcllm version with
+    a different config schema are never read.
+    """
+    fields = [
+        f"{model.__name__}.{name}:{info.annotation}={info.default!r}"
+        for model in (ProviderConfig, ProviderSettings, ModelMetadata)
+        for name, info in model.model_fields.items()
+    ]
+    return hashlib.sha256("\n".join(fields).encode()).hexdigest()[:8]
+
+
+def _parsed_cache_file(path: Path) -> Path | None:
+    """Return the cache entry for *path*, keyed by its location, mtime and size.
+
+    Editing or replacing the TOML file, or upgrading to an arcllm with a
+    different config schema, changes the key, so stale entries are never
+    read.
+    """
+    cache_dir = _config_cache_dir()
+    if cache_dir is None:
+        return None
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    location = hashlib.sha256(str(path.resolve()).encode()).hexdigest()[:16]
+    return cache_dir / (
+        f"{path.stem}.{location}.{st.st_mtime_ns}.{st.st_size}"
+        f".{_config_schema_tag()}.json"
+    )
+
+
+def _read_parsed_cache(cache_file: Path | None) -> ProviderConfig | None:
+    """Load a cached ProviderConfig, or None on any miss or mismatch.
+
+    Entries are JSON re-validated through pydantic (never pickle), so a
+    tampered or outdated cache file can only cause a miss.
+    """
+    if cache_file is None:
+        return None
+    try:
+        return ProviderConfig.model_validate_json(cache_file.read_bytes())
+    except (OSError, ValidationError):
+        return None
+
+
+def _write_parsed_cache(cache_file: Path | None, config: ProviderConfig) -> None:
+    """Atomically store *config*; failures only cost the next cold start."""
+    if cache_file is None:
+        return
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(config.model_dump_json())
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass
+
+
 def _validate_provider_name(provider_name: str) -> None:
     """Validate provider name is safe for path construction.
 
@@ -139,7 +218,13 @@ def _validate_provider_name(provider_name: str) -> None:
         raise ArcLLMConfigError("Provider name cannot be empty")
     if len(provider_name) > 64:
         raise ArcLLMConfigError("Provider name too long (max 64 characters)")
-    if not _PROVIDER_NAME_RE.match(provider_name):
+    # ASCII identifier with no uppercase = [a-z_][a-z0-9_]*; then rule out "_".
+    if not (
+        provider_name.isascii()
+        and provider_name.isidentifier()
+        and provider_name.islower()
+        and provider_name[0] != "_"
+    ):
         raise ArcLLMConfigError(
             f"Invalid provider name '{provider_name}'. "
             "Must start with a letter and contain only lowercase letters, "
@@ -181,9 +266,17 @@ def load_provider_config(provider_name: str) -> ProviderConfig:
 
     Returns a typed ProviderConfig with connection settings and model metadata.
     Raises ArcLLMConfigError on any failure.
+
+    Parsed configs are cached on disk (``$XDG_CACHE_HOME/arcllm``) keyed by
+    the TOML file's path, mtime and size, so cold starts skip TOML parsing.
     """
     _validate_provider_name(provider_name)
     config_path = _get_config_dir() / "providers" / f"{provider_name}.toml"
+    cache_file = _parsed_cache_file(config_path)
+    cached = _read_parsed_cache(cache_file)
+    if cached is not None:
+        return cached
+
     data = _load_toml_file(config_path, f"provider config '{provider_name}'")
 
     try:
@@ -192,8 +285,10 @@ def load_provider_config(provider_name: str) -> ProviderConfig:
             name: ModelMetadata(**metadata)
             for name, metadata in data.get("models", {}).items()
         }
-        return ProviderConfig(provider=provider_settings, models=models)
+        config = ProviderConfig(provider=provider_settings, models=models)
     except ValidationError as e:
         raise ArcLLMConfigError(
             f"Invalid provider config for '{provider_name}': {e}"
         )
+    _write_parsed_cache(cache_file, config)
+    return config
@@ -42,10 +42,36 @@ def validate_log_level(config: dict[str, Any], default: str = "INFO") -> int:
     return getattr(logging, log_level_name)
 
 
+def _render_fields(fields: dict[str, Any]) -> list[str]:
+    """Render non-None fields as sanitized ``key=value`` strings."""
+    parts = []
+    for key, value in fields.items():
+        if value is None:
+            continue
+        if isinstance(value, str):
+            parts.append(f"{key}={_sanitize(value)}")
+        elif isinstance(value, float):
+            parts.append(f"{key}={value:.6f}")
+        else:
+            parts.append(f"{key}={value}")
+    return parts
+
+
+def render_fields(**fields: Any) -> str:
+    """Render fields exactly as ``log_structured`` would.
+
+    For fields fixed for a module's lifetime (e.g. provider): render them
+    once and pass the result as ``log_structured(..., prefix=...)``.
+    """
+    return " ".join(_render_fields(fields))
+
+
 def log_structured(
     logger: logging.Logger,
     level: int,
     label: str,
+    *,
+    prefix: str = "",
     **fields: Any,
 ) -> None:
     """Emit a structured log line with key=value pairs.
@@ -54,21 +80,15 @@ def log_structured(
         logger: Module-specific logger instance.
         level: Python logging level (e.g., logging.INFO).
         label: Log line prefix (e.g., "LLM call", "Audit").
+        prefix: Pre-rendered fields from ``render_fields``, placed first.
         **fields: Key-value pairs to log. None values are omitted.
             String values are sanitized against log injection.
     """
     if not logger.isEnabledFor(level):
         return
 
-    parts = []
-    for key, value in fields.items():
-        if value is None:
-            continue
-        if isinstance(value, str):
-            parts.append(f"{key}={_sanitize(value)}")
-        elif isinstance(value, float):
-            parts.append(f"{key}={value:.6f}")
-        else:
-            parts.append(f"{key}={value}")
+    parts = _render_fields(fields)
+    if prefix:
+        parts.insert(0, prefix)
 
     logger.log(level, "%s | %s", label, " ".join(parts))
@@ -19,6 +19,10 @@ class BaseModule(LLMProvider):
     Provides ``_tracer`` and ``_span()`` for OpenTelemetry span creation.
     """
 
+    # Subclasses that declare their own __slots__ get instances without a
+    # __dict__; those that don't keep one as before.
+    __slots__ = ("_config", "_inner")
+
     def __init__(self, config: dict[str, Any], inner: LLMProvider) -> None:
         self._config = config
         self._inner = inner
@@ -35,10 +39,18 @@ class BaseModule(LLMProvider):
         """Create a named OTel span as a context manager.
 
         Records exceptions and sets ERROR status on unhandled errors,
-        then re-raises. No-op when no SDK is configured (tracer returns
-        NonRecordingSpan).
+        then re-raises. No-op when no SDK is configured: the proxy tracer
+        would only hand back a NonRecordingSpan, so ``INVALID_SPAN`` is
+        yielded without touching the active context. The check runs per
+        call because an SDK may be installed later (e.g. by OtelModule).
         """
-        with self._tracer.start_as_current_span(name, attributes=attributes) as span:
+        tracer = self._tracer
+        if type(tracer) is trace.ProxyTracer and isinstance(
+            trace.get_tracer_provider(), trace.ProxyTracerProvider
+        ):
+            yield trace.INVALID_SPAN
+            return
+        with tracer.start_as_current_span(name, attributes=attributes) as span:
             try:
                 yield span
             except Exception as exc:
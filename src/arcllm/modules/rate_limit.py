@@ -17,21 +17,39 @@ class TokenBucket:
 
     Starts full at *capacity* tokens. Each ``acquire()`` consumes one token.
     Tokens refill at *refill_rate* per second, capped at *capacity*.
+
+    A caller that finds the bucket empty reserves the next token by driving
+    the balance negative, then sleeps until that token has refilled. The
+    refill-and-reserve step contains no ``await``, so it is atomic within
+    the event loop and needs no lock; waiters are served in arrival order.
+    A waiter cancelled mid-sleep returns its reserved token.
     """
 
+    __slots__ = (
+        "_capacity",
+        "_tokens",
+        "_refill_rate",
+        "_refill_rate_per_ns",
+        "_last_refill_ns",
+    )
+
     def __init__(self, capacity: int, refill_rate: float) -> None:
         self._capacity = capacity
         self._tokens: float = float(capacity)
         self._refill_rate = refill_rate
-        self._last_refill = time.monotonic()
-        self._lock = asyncio.Lock()
+        self._refill_rate_per_ns = refill_rate / 1_000_000_000
+        self._last_refill_ns = time.monotonic_ns()
 
     def _refill(self) -> None:
         """Add tokens based on elapsed time, capped at capacity."""
-        now = time.monotonic()
-        elapsed = now - self._last_refill
-        self._tokens = min(self._capacity, self._tokens + elapsed * self._refill_rate)
-        self._last_refill = now
+        now_ns = time.monotonic_ns()
+        if self._tokens < self._capacity:
+            elapsed_ns = now_ns - self._last_refill_ns
+            self._tokens = min(
+                self._capacity,
+                self._tokens + elapsed_ns * self._refill_rate_per_ns,
+            )
+        self._last_refill_ns = now_ns
 
     async def acquire(self) -> float:
         """Consume one token, waiting if the bucket is empty.
@@ -39,21 +57,22 @@ class TokenBucket:
         Returns the wait time in seconds (0.0 if a token was immediately
         available).
         """
-        total_wait = 0.0
-        while True:
-            async with self._lock:
-                self._refill()
-                if self._tokens >= 1.0:
-                    self._tokens -= 1.0
-                    return total_wait
-                # Calculate wait for next token
-                deficit = 1.0 - self._tokens
-                wait_seconds = deficit / self._refill_rate
-
-            # Sleep *outside* the lock so other callers aren't serialised.
-            # If another waiter consumed our token, the loop re-checks.
+        self._refill()
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return 0.0
+        # Reserve the next token: a negative balance is owed to waiters
+        # already queued, so each caller's wait covers everyone ahead of it.
+        wait_seconds = (1.0 - self._tokens) / self._refill_rate
+        self._tokens -= 1.0
+        try:
             await asyncio.sleep(wait_seconds)
-            total_wait += wait_seconds
+        except asyncio.CancelledError:
+            # Hand the reservation back so a cancelled caller (timeout,
+            # disconnect) does not push back everyone queued after it.
+            self._tokens = min(self._capacity, self._tokens + 1.0)
+            raise
+        return wait_seconds
 
 
 # ---------------------------------------------------------------------------
@@ -66,10 +85,19 @@ _bucket_registry: dict[str, TokenBucket] = {}
 def _get_or_create_bucket(
     provider: str, capacity: int, refill_rate: float
 ) -> TokenBucket:
-    """Return the shared bucket for *provider*, creating one if needed."""
-    if provider not in _bucket_registry:
-        _bucket_registry[provider] = TokenBucket(capacity, refill_rate)
-    return _bucket_registry[provider]
+    """Return the shared bucket for *provider*, creating one if needed.
+
+    Keyed by provider only: every module for a provider must share one
+    bucket even if configured with different limits (the first wins).
+    ``dict.setdefault`` is a single atomic step, so concurrent first calls
+    still agree on one bucket.
+    """
+    bucket = _bucket_registry.get(provider)
+    if bucket is None:
+        bucket = _bucket_registry.setdefault(
+            provider, TokenBucket(capacity, refill_rate)
+        )
+    return bucket
 
 
 def clear_buckets() -> None:
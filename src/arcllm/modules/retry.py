@@ -1,8 +1,10 @@
 """RetryModule — exponential backoff with jitter on transient failures."""
 
 import asyncio
+import functools
 import logging
 import random
+from collections.abc import Callable
 from typing import Any
 
 import httpx
@@ -14,7 +16,48 @@ from arcllm.types import LLMProvider, LLMResponse, Message, Tool
 logger = logging.getLogger(__name__)
 
 # Default retryable HTTP status codes.
-_DEFAULT_RETRYABLE_CODES = [429, 500, 502, 503, 529]
+_DEFAULT_RETRYABLE_CODES = frozenset({429, 500, 502, 503, 529})
+
+# Status codes below this are classified through a flat lookup table.
+_STATUS_TABLE_SIZE = 600
+
+# Connection-level failures that are always retried.
+_RETRYABLE_TRANSPORT = (httpx.ConnectError, httpx.TimeoutException)
+
+# Bound once; backoff * _rand() is uniform(0, backoff) without the call overhead.
+_rand = random.random
+
+
+@functools.lru_cache(maxsize=64)
+def _make_status_predicate(codes: frozenset[int]) -> Callable[[int], bool]:
+    """Retryable-status check, shared by every RetryModule with the same codes.
+
+    Codes below ``_STATUS_TABLE_SIZE`` are one bytearray index; anything
+    else falls back to the set.
+    """
+    table = bytearray(_STATUS_TABLE_SIZE)
+    for code in codes:
+        if 0 <= code < _STATUS_TABLE_SIZE:
+            table[code] = 1
+
+    def is_retryable(code: int) -> bool:
+        return bool(table[code]) if 0 <= code < _STATUS_TABLE_SIZE else code in codes
+
+    return is_retryable
+
+
+@functools.lru_cache(maxsize=64)
+def _make_schedule(base: float, cap: float, retries: int) -> tuple[float, ...]:
+    """Backoff per attempt, shared by every RetryModule with the same config.
+
+    Doubling stops at the cap so large retry counts cannot overflow.
+    """
+    schedule: list[float] = []
+    backoff = min(base, cap)
+    for _ in range(retries):
+        schedule.append(backoff)
+        backoff = min(backoff * 2, cap)
+    return tuple(schedule)
 
 
 class RetryModule(BaseModule):
@@ -31,12 +74,21 @@ class RetryModule(BaseModule):
         retryable_status_codes: HTTP codes to retry (default: [429,500,502,503,529]).
     """
 
+    __slots__ = (
+        "_max_retries",
+        "_backoff_base",
+        "_max_wait",
+        "_retryable_codes",
+        "_is_retryable_status",
+        "_schedule",
+    )
+
     def __init__(self, config: dict[str, Any], inner: LLMProvider) -> None:
         super().__init__(config, inner)
         self._max_retries: int = config.get("max_retries", 3)
         self._backoff_base: float = config.get("backoff_base_seconds", 1.0)
         self._max_wait: float = config.get("max_wait_seconds", 60.0)
-        self._retryable_codes: set[int] = set(
+        self._retryable_codes: frozenset[int] = frozenset(
             config.get("retryable_status_codes", _DEFAULT_RETRYABLE_CODES)
         )
         # Validate config bounds
@@ -46,6 +98,15 @@ class RetryModule(BaseModule):
             raise ArcLLMConfigError("backoff_base_seconds must be > 0")
         if self._max_wait <= 0:
             raise ArcLLMConfigError("max_wait_seconds must be > 0")
+        for code in self._retryable_codes:
+            if isinstance(code, bool) or not isinstance(code, int):
+                raise ArcLLMConfigError(
+                    f"retryable_status_codes must be integers, got {code!r}"
+                )
+        self._is_retryable_status = _make_status_predicate(self._retryable_codes)
+        self._schedule = _make_schedule(
+            self._backoff_base, self._max_wait, self._max_retries
+        )
 
     async def invoke(
         self,
@@ -56,41 +117,40 @@ class RetryModule(BaseModule):
         from opentelemetry.trace import StatusCode
 
         last_error: Exception | None = None
+        # Bound once rather than looked up on every attempt.
+        invoke = self._inner.invoke
+        is_retryable_status = self._is_retryable_status
+        sleep = asyncio.sleep
 
         with self._span("arcllm.retry") as retry_span:
             for attempt in range(self._max_retries + 1):
                 with self._span("arcllm.retry.attempt", attributes={"arcllm.retry.attempt": attempt}) as attempt_span:
                     try:
-                        return await self._inner.invoke(messages, tools, **kwargs)
-                    except (ArcLLMAPIError, httpx.ConnectError, httpx.TimeoutException) as e:
-                        if not self._is_retryable(e):
+                        return await invoke(messages, tools, **kwargs)
+                    except _RETRYABLE_TRANSPORT as e:
+                        last_error = e
+                    except ArcLLMAPIError as e:
+                        if not is_retryable_status(e.status_code):
                             raise
                         last_error = e
-                        attempt_span.record_exception(e)
-                        attempt_span.set_status(StatusCode.OK)
-                        if attempt < self._max_retries:
-                            wait = self._calculate_wait(attempt, e)
+                    attempt_span.record_exception(last_error)
+                    attempt_span.set_status(StatusCode.OK)
+                    if attempt < self._max_retries:
+                        wait = self._calculate_wait(attempt, last_error)
+                        if logger.isEnabledFor(logging.WARNING):
                             logger.warning(
                                 "Retry attempt %d/%d after %.2fs: %s",
                                 attempt + 1,
                                 self._max_retries,
                                 wait,
-                                e,
+                                last_error,
                             )
-                            await asyncio.sleep(wait)
+                        await sleep(wait)
 
             logger.error("All %d retries exhausted: %s", self._max_retries, last_error)
             retry_span.set_status(StatusCode.ERROR)
             raise last_error  # type: ignore[misc]
 
-    def _is_retryable(self, error: Exception) -> bool:
-        """Check if an error is retryable."""
-        if isinstance(error, ArcLLMAPIError):
-            return error.status_code in self._retryable_codes
-        if isinstance(error, (httpx.ConnectError, httpx.TimeoutException)):
-            return True
-        return False
-
     def _calculate_wait(self, attempt: int, error: Exception | None = None) -> float:
         """Calculate wait time with exponential backoff + proportional jitter.
 
@@ -100,6 +160,6 @@ class RetryModule(BaseModule):
         # Honor Retry-After header if present
         if isinstance(error, ArcLLMAPIError) and error.retry_after is not None:
             return min(error.retry_after, self._max_wait)
-        backoff = self._backoff_base * (2**attempt)
-        jitter = random.uniform(0, backoff)
+        backoff = self._schedule[attempt]
+        jitter = backoff * _rand()
         return min(backoff + jitter, self._max_wait)
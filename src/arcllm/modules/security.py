@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+from collections.abc import Callable, Iterable, Sequence
 from typing import Any
 
-from arcllm._pii import PiiDetector, RegexPiiDetector, redact_text
+from arcllm._pii import (
+    HyperscanPiiDetector,
+    PiiDetector,
+    RegexPiiDetector,
+    default_detector,
+    redact_text,
+)
 from arcllm._signing import canonical_payload, create_signer, RequestSigner
 from arcllm.exceptions import ArcLLMConfigError
 from arcllm.modules.base import BaseModule
 from arcllm.types import (
     ContentBlock,
+    ImageBlock,
     LLMProvider,
     LLMResponse,
     Message,
@@ -24,13 +32,20 @@ _VALID_CONFIG_KEYS = {
     "pii_enabled",
     "pii_detector",
     "pii_custom_patterns",
+    "pii_match_timeout",
     "signing_enabled",
     "signing_algorithm",
     "signing_key_env",
     "enabled",
 }
 
-_VALID_DETECTORS = {"regex"}
+_VALID_DETECTORS = {"regex", "hyperscan"}
+
+
+def _discard_result(future: asyncio.Future[Any]) -> None:
+    """Retrieve an abandoned future's outcome so errors are not logged."""
+    if not future.cancelled():
+        future.exception()
 
 
 class SecurityModule(BaseModule):
@@ -38,9 +53,10 @@ class SecurityModule(BaseModule):
 
     Phases per invoke():
         1. Redact PII from outbound messages (to LLM)
-        2. Call inner.invoke() with redacted messages
+        2. Call inner.invoke() with redacted messages; the request payload
+           is signed in a worker thread while the call is in flight
         3. Redact PII from inbound response (from LLM)
-        4. Sign request payload and attach to response metadata
+        4. Attach the request signature to response metadata
 
     Stack position: Audit -> Security -> Retry
     (Audit sees redacted data; each retry sends redacted+signed request)
@@ -64,14 +80,22 @@ class SecurityModule(BaseModule):
         if self._pii_enabled:
             detector_type = config.get("pii_detector", "regex")
             custom_patterns = config.get("pii_custom_patterns", [])
+            match_timeout = config.get("pii_match_timeout")
             if detector_type not in _VALID_DETECTORS:
                 raise ArcLLMConfigError(
                     f"Unsupported pii_detector type: {detector_type!r}. "
                     f"Supported: {sorted(_VALID_DETECTORS)}"
                 )
-            self._pii_detector = RegexPiiDetector(
-                custom_patterns=custom_patterns or None
-            )
+            if detector_type == "hyperscan":
+                self._pii_detector = HyperscanPiiDetector(
+                    custom_patterns=custom_patterns, match_timeout=match_timeout
+                )
+            elif custom_patterns or match_timeout is not None:
+                self._pii_detector = RegexPiiDetector(
+                    custom_patterns=custom_patterns, match_timeout=match_timeout
+                )
+            else:
+                self._pii_detector = default_detector()
 
         # Build signer (lazy — only if signing enabled)
         self._signer: RequestSigner | None = None
@@ -92,23 +116,64 @@ class SecurityModule(BaseModule):
                 with self._span("security.pii_redact_outbound"):
                     messages = self._redact_messages(messages)
 
-            # Phase 2: Call inner provider
-            response = await self._inner.invoke(messages, tools, **kwargs)
+            # Phase 2: Call inner provider. The signature covers only the
+            # outbound request, so it is computed off the event loop while the
+            # provider call is in flight.
+            sign_task: asyncio.Future[str] | None = None
+            if self._signing_enabled and self._signer is not None:
+                sign_task = asyncio.ensure_future(
+                    asyncio.to_thread(self._sign_request, messages, tools)
+                )
+            try:
+                response = await self._inner.invoke(messages, tools, **kwargs)
 
-            # Phase 3: PII redaction on inbound response
-            if self._pii_enabled and self._pii_detector is not None:
-                with self._span("security.pii_redact_inbound"):
-                    response = self._redact_response(response)
+                # Phase 3: PII redaction on inbound response
+                if self._pii_enabled and self._pii_detector is not None:
+                    with self._span("security.pii_redact_inbound"):
+                        response = self._redact_response(response)
+            except BaseException:
+                # Never leave the signing task's outcome unretrieved
+                if sign_task is not None:
+                    sign_task.add_done_callback(_discard_result)
+                raise
 
-            # Phase 4: Sign request and attach to response
-            if self._signing_enabled and self._signer is not None:
-                with self._span("security.sign"):
-                    payload = canonical_payload(messages, tools, self.model_name)
-                    signature = self._signer.sign(payload)
-                    response = self._attach_signature(response, signature)
+            # Phase 4: Attach the request signature to the response
+            if sign_task is not None:
+                response = self._attach_signature(response, await sign_task)
 
             return response
 
+    def _sign_request(self, messages: list[Message], tools: list[Tool] | None) -> str:
+        """Sign the canonical request payload (runs in a worker thread)."""
+        with self._span("security.sign"):
+            payload = canonical_payload(messages, tools, self.model_name)
+            return self._signer.sign(payload)
+
+    def sign_requests(
+        self, requests: Iterable[tuple[list[Message], list[Tool] | None]]
+    ) -> list[str]:
+        """Sign several outbound requests in one batch.
+
+        For callers that send more than one request per turn (fan-out to
+        several providers, ensembles). Each signature is the
+        ``request_signature`` that invoke() would attach for the same
+        messages and tools, PII redaction included.
+
+        Raises:
+            ArcLLMConfigError: If signing is disabled.
+        """
+        if self._signer is None:
+            raise ArcLLMConfigError("sign_requests() requires signing_enabled")
+        redact = self._pii_enabled and self._pii_detector is not None
+        model = self.model_name
+        payloads = [
+            canonical_payload(
+                self._redact_messages(messages) if redact else messages, tools, model
+            )
+            for messages, tools in requests
+        ]
+        return self._signer.sign_batch(payloads)
+
     def _redact_messages(self, messages: list[Message]) -> list[Message]:
         """Redact PII from all messages, returning new list."""
         result: list[Message] = []
@@ -124,46 +189,94 @@ class SecurityModule(BaseModule):
         return result
 
     def _redact_blocks(self, blocks: list[ContentBlock]) -> list[ContentBlock]:
-        """Redact PII from ContentBlock list."""
+        """Redact PII from ContentBlock list, dispatching on block type."""
+        redactors = self._BLOCK_REDACTORS
         result: list[ContentBlock] = []
         for block in blocks:
-            if isinstance(block, TextBlock):
-                redacted = self._redact_str(block.text)
-                result.append(TextBlock(text=redacted))
-            elif isinstance(block, ToolResultBlock):
-                if isinstance(block.content, str):
-                    redacted = self._redact_str(block.content)
-                    result.append(
-                        ToolResultBlock(
-                            tool_use_id=block.tool_use_id,
-                            content=redacted,
-                        )
-                    )
-                else:
-                    result.append(block)
-            elif isinstance(block, ToolUseBlock):
-                # Scan arguments as JSON string
-                args_str = json.dumps(block.arguments)
-                redacted_str = self._redact_str(args_str)
-                if redacted_str != args_str:
-                    redacted_args = json.loads(redacted_str)
-                    result.append(
-                        ToolUseBlock(
-                            id=block.id,
-                            name=block.name,
-                            arguments=redacted_args,
-                        )
-                    )
-                else:
-                    result.append(block)
-            else:
-                # ImageBlock and others pass through
-                result.append(block)
+            redact = redactors.get(type(block))
+            if redact is None:
+                redact = self._redactor_for(type(block))
+            result.append(redact(self, block))
         return result
 
+    def _redact_text_block(self, block: TextBlock) -> ContentBlock:
+        return TextBlock(text=self._redact_str(block.text))
+
+    def _redact_tool_result_block(self, block: ToolResultBlock) -> ContentBlock:
+        if not isinstance(block.content, str):
+            return block
+        return ToolResultBlock(
+            tool_use_id=block.tool_use_id,
+            content=self._redact_str(block.content),
+        )
+
+    def _redact_tool_use_block(self, block: ToolUseBlock) -> ContentBlock:
+        arguments = self._redact_tree(block.arguments)
+        if arguments is block.arguments:
+            return block
+        return ToolUseBlock(id=block.id, name=block.name, arguments=arguments)
+
+    def _redact_tree(self, obj: Any) -> Any:
+        """Redact PII in the keys and leaves of a JSON-like value.
+
+        Returns *obj* itself when nothing was redacted. Numeric leaves are
+        scanned in their JSON spelling and become the redacted string when
+        they match (e.g. a phone number stored as an int).
+        """
+        if isinstance(obj, str):
+            return self._redact_str(obj)
+        if isinstance(obj, dict):
+            changed = False
+            result: dict[Any, Any] = {}
+            for key, value in obj.items():
+                new_key = self._redact_str(key) if isinstance(key, str) else key
+                new_value = self._redact_tree(value)
+                changed = changed or new_key is not key or new_value is not value
+                result[new_key] = new_value
+            return result if changed else obj
+        if isinstance(obj, Sequence) and not isinstance(obj, (bytes, bytearray)):
+            # Tuples and other sequences come back as lists when redacted,
+            # matching their JSON round-trip.
+            items = [self._redact_tree(item) for item in obj]
+            if any(new is not old for new, old in zip(items, obj)):
+                return items
+            return obj
+        if isinstance(obj, (int, float)) and not isinstance(obj, bool):
+            text = str(obj)
+            redacted = self._redact_str(text)
+            return obj if redacted == text else redacted
+        return obj
+
+    def _pass_block(self, block: ContentBlock) -> ContentBlock:
+        return block
+
+    # Exact block type -> redactor. ImageBlock and other blocks pass through.
+    _BLOCK_REDACTORS: dict[type, Callable[[SecurityModule, Any], ContentBlock]] = {
+        TextBlock: _redact_text_block,
+        ToolResultBlock: _redact_tool_result_block,
+        ToolUseBlock: _redact_tool_use_block,
+        ImageBlock: _pass_block,
+    }
+
+    @classmethod
+    def _redactor_for(
+        cls, block_type: type
+    ) -> Callable[[SecurityModule, Any], ContentBlock]:
+        """Resolve a block subclass to its base type's redactor, and cache it."""
+        for base in block_type.__mro__[1:]:
+            redact = cls._BLOCK_REDACTORS.get(base)
+            if redact is not None:
+                break
+        else:
+            redact = cls._pass_block
+        return cls._BLOCK_REDACTORS.setdefault(block_type, redact)
+
     def _redact_str(self, text: str) -> str:
         """Detect and redact PII in a string."""
-        matches = self._pii_detector.detect(text)
+        detector = self._pii_detector
+        if isinstance(detector, RegexPiiDetector):
+            return detector.redact(text)
+        matches = detector.detect(text)
         if not matches:
             return text
         return redact_text(text, matches)
@@ -1,11 +1,15 @@
 """TelemetryModule — structured logging of timing, tokens, and cost per invoke()."""
 
 import logging
-import time
+from time import monotonic
 from typing import Any
 
 from arcllm.exceptions import ArcLLMConfigError
-from arcllm.modules._logging import log_structured, validate_log_level
+from arcllm.modules._logging import (
+    log_structured,
+    render_fields,
+    validate_log_level,
+)
 from arcllm.modules.base import BaseModule
 from arcllm.types import LLMProvider, LLMResponse, Message, Tool, Usage
 
@@ -56,22 +60,29 @@ class TelemetryModule(BaseModule):
         if self._cost_cache_write < 0:
             raise ArcLLMConfigError("cost_cache_write_per_1m must be >= 0")
 
+        # Per-1M rates in Usage field order: input, output, cache read, write
+        self._rates: tuple[float, float, float, float] = (
+            self._cost_input,
+            self._cost_output,
+            self._cost_cache_read,
+            self._cost_cache_write,
+        )
+        # Unpriced (e.g. local) providers skip the cost arithmetic entirely
+        self._priced: bool = any(self._rates)
+
         self._log_level: int = validate_log_level(config)
+        self._log_prefix: str = render_fields(provider=inner.name)
 
     def _calculate_cost(self, usage: Usage) -> float:
         """Calculate USD cost from token counts and per-1M pricing."""
-        cost = (
-            usage.input_tokens * self._cost_input
-            + usage.output_tokens * self._cost_output
+        rate_in, rate_out, rate_read, rate_write = self._rates
+        return (
+            usage.input_tokens * rate_in
+            + usage.output_tokens * rate_out
+            + (usage.cache_read_tokens or 0) * rate_read
+            + (usage.cache_write_tokens or 0) * rate_write
         ) / 1_000_000
 
-        if usage.cache_read_tokens:
-            cost += usage.cache_read_tokens * self._cost_cache_read / 1_000_000
-        if usage.cache_write_tokens:
-            cost += usage.cache_write_tokens * self._cost_cache_write / 1_000_000
-
-        return cost
-
     async def invoke(
         self,
         messages: list[Message],
@@ -79,22 +90,30 @@ class TelemetryModule(BaseModule):
         **kwargs: Any,
     ) -> LLMResponse:
         with self._span("arcllm.telemetry") as tel_span:
-            start = time.monotonic()
+            start = monotonic()
             response = await self._inner.invoke(messages, tools, **kwargs)
-            elapsed = time.monotonic() - start
+            elapsed = monotonic() - start
+
+            # Nothing consumes the numbers: skip cost math and formatting
+            log_enabled = logger.isEnabledFor(self._log_level)
+            if not log_enabled and not tel_span.is_recording():
+                return response
 
             usage = response.usage
-            cost = self._calculate_cost(usage)
+            cost = self._calculate_cost(usage) if self._priced else 0.0
             duration_ms = round(elapsed * 1000, 1)
 
             tel_span.set_attribute("arcllm.telemetry.duration_ms", duration_ms)
             tel_span.set_attribute("arcllm.telemetry.cost_usd", cost)
 
+            if not log_enabled:
+                return response
+
             log_structured(
                 logger,
                 self._log_level,
                 "LLM call",
-                provider=self._inner.name,
+                prefix=self._log_prefix,
                 model=response.model,
                 duration_ms=duration_ms,
                 input_tokens=usage.input_tokens,
@@ -1,10 +1,18 @@
 """Provider registry — convention-based adapter discovery and load_model()."""
 
+import functools
 import importlib
 import os
+import sys
+from types import ModuleType
 from typing import Any
 
-from arcllm.config import ProviderConfig, load_global_config, load_provider_config
+from arcllm.config import (
+    GlobalConfig,
+    ProviderConfig,
+    load_global_config,
+    load_provider_config,
+)
 from arcllm.exceptions import ArcLLMConfigError
 from arcllm.types import LLMProvider
 
@@ -13,43 +21,99 @@ from arcllm.types import LLMProvider
 # Under free-threaded Python (PEP 703, --disable-gil), a threading.Lock
 # would be needed around cache-miss writes. Current async-first design
 # means all access is single-threaded within an event loop.
-_provider_config_cache: dict[str, ProviderConfig] = {}
 _adapter_class_cache: dict[str, type[LLMProvider]] = {}
-_global_config_cache: dict[str, Any] | None = None
 _module_settings_cache: dict[str, dict[str, Any]] = {}
+_any_module_enabled: bool = False
 _vault_resolver_cache: Any | None = None
 
 
 def clear_cache() -> None:
     """Reset all registry caches. Use in tests for isolation."""
-    global _global_config_cache, _vault_resolver_cache
-    _provider_config_cache.clear()
+    global _vault_resolver_cache, _any_module_enabled
+    _load_config_cached.cache_clear()
     _adapter_class_cache.clear()
-    _global_config_cache = None
+    _get_global_config.cache_clear()
+    _any_module_enabled = False
     _module_settings_cache.clear()
     _vault_resolver_cache = None
     from arcllm.modules.rate_limit import clear_buckets
 
     clear_buckets()
 
+    from arcllm._signing import clear_signer_cache
+
+    clear_signer_cache()
+
     import arcllm.modules.otel as _otel_mod
 
     _otel_mod._sdk_configured = False
 
 
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(provider_name: str) -> ProviderConfig:
+    """Load a provider config, keeping the 32 most recently used in memory.
+
+    Bounded so long-running processes that load many dynamic providers
+    don't grow without limit. ``load_provider_config`` is looked up at call
+    time so tests can patch it.
+    """
+    return load_provider_config(provider_name)
+
+
+@functools.cache
+def _get_global_config() -> GlobalConfig:
+    """Load config.toml once and pre-extract per-module settings."""
+    global _any_module_enabled
+    global_config = load_global_config()
+    # Pre-extract module settings (avoids model_dump() per call)
+    for name, cfg in global_config.modules.items():
+        _module_settings_cache[name] = {
+            k: v for k, v in cfg.model_dump().items() if k != "enabled"
+        }
+    _any_module_enabled = any(cfg.enabled for cfg in global_config.modules.values())
+    return global_config
+
+
+def _cached_import(module_path: str) -> ModuleType:
+    """Import *module_path*, returning it straight from ``sys.modules`` if loaded.
+
+    ``importlib.import_module`` takes the import lock and walks the finder
+    chain even for loaded modules; a fully initialised entry in
+    ``sys.modules`` needs only a dict lookup. Modules still initialising
+    (circular imports) go through the normal import machinery.
+    """
+    module = sys.modules.get(module_path)
+    if module is not None and not getattr(
+        getattr(module, "__spec__", None), "_initializing", False
+    ):
+        return module
+    return importlib.import_module(module_path)
+
+
 def _get_adapter_class(provider_name: str) -> type[LLMProvider]:
+    """Return the cached adapter class, loading it on first use.
+
+    Concurrent cold starts may each load the class; ``setdefault`` makes
+    every caller see the same winning entry.
+    """
+    adapter_class = _adapter_class_cache.get(provider_name)
+    if adapter_class is None:
+        adapter_class = _adapter_class_cache.setdefault(
+            provider_name, _load_adapter_class(provider_name)
+        )
+    return adapter_class
+
+
+def _load_adapter_class(provider_name: str) -> type[LLMProvider]:
     """Look up the adapter class by naming convention.
 
     Convention:
         provider_name -> module: arcllm.adapters.{provider_name}
         provider_name -> class:  {provider_name.title()}Adapter
     """
-    if provider_name in _adapter_class_cache:
-        return _adapter_class_cache[provider_name]
-
     module_path = f"arcllm.adapters.{provider_name}"
     try:
-        module = importlib.import_module(module_path)
+        module = _cached_import(module_path)
     except ImportError:
         raise ArcLLMConfigError(
             f"No adapter module found for provider '{provider_name}'. "
@@ -63,7 +127,6 @@ def _get_adapter_class(provider_name: str) -> type[LLMProvider]:
             f"No adapter class '{class_name}' found in module '{module_path}'"
         )
 
-    _adapter_class_cache[provider_name] = adapter_class
     return adapter_class
 
 
@@ -82,17 +145,8 @@ def _resolve_module_config(
     Returns:
         Module config dict if enabled, None if disabled.
     """
-    global _global_config_cache
-    if _global_config_cache is None:
-        _global_config_cache = load_global_config()
-        # Pre-extract module settings (avoids model_dump() per call)
-        for name, cfg in _global_config_cache.modules.items():
-            _module_settings_cache[name] = {
-                k: v for k, v in cfg.model_dump().items() if k != "enabled"
-            }
-
     # Get config.toml settings for this module
-    module_cfg = _global_config_cache.modules.get(module_name)
+    module_cfg = _get_global_config().modules.get(module_name)
     config_enabled = module_cfg.enabled if module_cfg else False
     config_settings = _module_settings_cache.get(module_name, {})
 
@@ -163,24 +217,14 @@ def load_model(
         ArcLLMConfigError: On missing config, missing adapter, or invalid provider name.
     """
     # Load and cache provider config
-    if provider not in _provider_config_cache:
-        _provider_config_cache[provider] = load_provider_config(provider)
-    config = _provider_config_cache[provider]
+    config = _load_config_cached(provider)
 
     # Resolve model name
     model_name = model or config.provider.default_model
 
     # Resolve API key via vault if configured
-    global _global_config_cache
-    if _global_config_cache is None:
-        _global_config_cache = load_global_config()
-        for name, cfg in _global_config_cache.modules.items():
-            _module_settings_cache[name] = {
-                k: v for k, v in cfg.model_dump().items() if k != "enabled"
-            }
-
     global _vault_resolver_cache
-    vault_cfg = _global_config_cache.vault
+    vault_cfg = _get_global_config().vault
     if vault_cfg.backend:
         from arcllm.vault import VaultResolver
 
@@ -202,6 +246,19 @@ def load_model(
     # Construct adapter
     result: LLMProvider = adapter_class(config, model_name)
 
+    # Fast path: no module requested by kwarg or enabled in config.toml
+    if (
+        not _any_module_enabled
+        and retry is None
+        and fallback is None
+        and rate_limit is None
+        and telemetry is None
+        and audit is None
+        and security is None
+        and otel is None
+    ):
+        return result
+
     # Apply module wrapping (innermost first): RateLimit, Fallback, Retry
     rate_limit_config = _resolve_module_config("rate_limit", rate_limit)
     if rate_limit_config is not None:
@@ -122,6 +122,8 @@ class LLMResponse(BaseModel):
 
 
 class LLMProvider(ABC):
+    __slots__ = ()
+
     name: str
 
     @abstractmethod
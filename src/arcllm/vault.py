@@ -26,6 +26,16 @@ class VaultBackend(Protocol):
         ...
 
 
+class _CacheEntry:
+    """Cached secret with its expiry on the ``monotonic_ns`` clock."""
+
+    __slots__ = ("value", "expiry_ns")
+
+    def __init__(self, value: str, expiry_ns: int) -> None:
+        self.value = value
+        self.expiry_ns = expiry_ns
+
+
 class VaultResolver:
     """Resolve API keys from vault with TTL cache and env var fallback.
 
@@ -41,8 +51,8 @@ class VaultResolver:
         cache_ttl_seconds: int = 300,
     ) -> None:
         self._backend = backend
-        self._cache_ttl = cache_ttl_seconds
-        self._cache: dict[str, tuple[str, float]] = {}  # path -> (value, expiry)
+        self._cache_ttl_ns = int(cache_ttl_seconds * 1_000_000_000)
+        self._cache: dict[str, _CacheEntry] = {}
 
     @classmethod
     def from_config(cls, backend_ref: str, cache_ttl_seconds: int) -> VaultResolver:
@@ -143,12 +153,14 @@ class VaultResolver:
         entry = self._cache.get(path)
         if entry is None:
             return None
-        value, expiry = entry
-        if time.monotonic() > expiry:
-            del self._cache[path]
+        if time.monotonic_ns() > entry.expiry_ns:
+            # Left for the next store to overwrite: evicting here could
+            # drop a fresh entry another thread stored after our check.
             return None
-        return value
+        return entry.value
 
     def _set_cached(self, path: str, value: str) -> None:
-        """Store value in cache with TTL."""
-        self._cache[path] = (value, time.monotonic() + self._cache_ttl)
+        """Store value in cache with TTL (no-op when the TTL is 0)."""
+        if self._cache_ttl_ns <= 0:
+            return
+        self._cache[path] = _CacheEntry(value, time.monotonic_ns() + self._cache_ttl_ns)
@@ -0,0 +1,54 @@
+"""Shared test fixtures."""
+
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@dataclass
+class FakeSpan:
+    """Plain-Python span stand-in; only the recording methods are mocks."""
+
+    _name: str
+    set_attribute: MagicMock = field(default_factory=MagicMock)
+    set_status: MagicMock = field(default_factory=MagicMock)
+    record_exception: MagicMock = field(default_factory=MagicMock)
+    add_event: MagicMock = field(default_factory=MagicMock)
+    is_recording: MagicMock = field(
+        default_factory=lambda: MagicMock(return_value=True)
+    )
+
+
+@dataclass
+class FakeTracer:
+    """Tracer stand-in that records every span it starts."""
+
+    spans: list[FakeSpan] = field(default_factory=list)
+    by_name: dict[str, list[FakeSpan]] = field(default_factory=dict)
+
+    def start_as_current_span(self, name, attributes=None):
+        span = FakeSpan(name)
+        self.spans.append(span)
+        self.by_name.setdefault(name, []).append(span)
+        return nullcontext(span)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_config_cache(tmp_path_factory):
+    """Keep the parsed-config disk cache out of the real user cache dir."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("xdg_cache")))
+        mp.delenv("ARCLLM_DISABLE_CONFIG_CACHE", raising=False)
+        yield
+
+
+@pytest.fixture
+def fake_tracer(monkeypatch) -> FakeTracer:
+    """Route every ``trace.get_tracer()`` call to a recording FakeTracer."""
+    tracer = FakeTracer()
+    monkeypatch.setattr(
+        "opentelemetry.trace.get_tracer", lambda *args, **kwargs: tracer
+    )
+    return tracer
@@ -73,6 +73,17 @@ class TestBaseModuleSpan:
             # No-op tracer returns a NonRecordingSpan
             assert span is not None
 
+    def test_span_without_sdk_skips_tracer(self):
+        """Without an SDK provider, no span is started or made current."""
+        module = BaseModule({}, _make_inner())
+        outer = trace.get_current_span()
+        with patch.object(
+            trace.ProxyTracer, "start_as_current_span"
+        ) as mock_start, module._span("test.span") as span:
+            assert span is trace.INVALID_SPAN
+            assert trace.get_current_span() is outer
+        mock_start.assert_not_called()
+
     def test_span_records_exception_on_error(self):
         """Unhandled exception is recorded on the span."""
         module = BaseModule({}, _make_inner())
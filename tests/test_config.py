@@ -12,6 +12,7 @@ from arcllm.config import (
     ModuleConfig,
     ProviderConfig,
     ProviderSettings,
+    _load_toml_file,
     _validate_provider_name,
     load_global_config,
     load_provider_config,
@@ -139,7 +140,25 @@ def test_provider_name_too_long():
         load_provider_config("a" * 65)
 
 
-@pytest.mark.parametrize("name", ["../evil", "pro/vider", "a@b", "a b", ".hidden", "my-hyphen"])
+@pytest.mark.parametrize(
+    "name",
+    [
+        "../evil",
+        "pro/vider",
+        "a@b",
+        "a b",
+        ".hidden",
+        "my-hyphen",
+        "1provider",
+        "_private",
+        "caf\u00e9",
+        "a\x00b",
+        "Anthropic",
+        "openAI",
+        "\u00e9t\u00e9",
+        "a\u0661",
+    ],
+)
 def test_invalid_provider_names(name):
     with pytest.raises(ArcLLMConfigError):
         load_provider_config(name)
@@ -204,6 +223,83 @@ def test_missing_global_config_raises_config_error(tmp_path):
             load_global_config()
 
 
+# --- Parsed provider config disk cache ---
+
+
+_CACHED_PROVIDER_TOML = (
+    '[provider]\napi_format = "openai-chat"\nbase_url = "https://api.example.com"\n'
+    'api_key_env = "OK"\ndefault_model = "m"\ndefault_temperature = 0.5\n'
+    "[models.m]\ncontext_window = 1000\nmax_output_tokens = 100\n"
+    "supports_tools = true\nsupports_vision = false\nsupports_thinking = false\n"
+    'input_modalities = ["text"]\ncost_input_per_1m = 1.0\n'
+    "cost_output_per_1m = 2.0\ncost_cache_read_per_1m = 0.0\n"
+    "cost_cache_write_per_1m = 0.0\n"
+)
+
+
+@pytest.fixture
+def cached_provider_dir(tmp_path, monkeypatch):
+    """Provider dir with one valid TOML and an empty, isolated cache dir."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    providers_dir = tmp_path / "providers"
+    providers_dir.mkdir()
+    (providers_dir / "cached.toml").write_text(_CACHED_PROVIDER_TOML)
+    with patch("arcllm.config._get_config_dir", return_value=tmp_path):
+        yield tmp_path
+
+
+def test_provider_config_served_from_disk_cache(cached_provider_dir):
+    first = load_provider_config("cached")
+    cache_dir = cached_provider_dir / "cache" / "arcllm"
+    assert len(list(cache_dir.glob("cached.*.json"))) == 1
+
+    with patch("arcllm.config._load_toml_file") as mock_toml:
+        second = load_provider_config("cached")
+    mock_toml.assert_not_called()
+    assert second == first
+
+
+def test_provider_config_cache_invalidated_on_edit(cached_provider_dir):
+    load_provider_config("cached")
+    toml_path = cached_provider_dir / "providers" / "cached.toml"
+    toml_path.write_text(_CACHED_PROVIDER_TOML.replace("0.5", "0.25"))
+
+    assert load_provider_config("cached").provider.default_temperature == 0.25
+
+
+def test_corrupt_cache_entry_falls_back_to_toml(cached_provider_dir):
+    load_provider_config("cached")
+    for entry in (cached_provider_dir / "cache" / "arcllm").glob("cached.*.json"):
+        entry.write_text("{not json")
+
+    assert load_provider_config("cached").provider.default_model == "m"
+
+
+def test_config_cache_can_be_disabled(cached_provider_dir, monkeypatch):
+    monkeypatch.setenv("ARCLLM_DISABLE_CONFIG_CACHE", "1")
+    load_provider_config("cached")
+    assert not (cached_provider_dir / "cache").exists()
+
+
+def test_config_cache_disabled_without_home_dir(cached_provider_dir, monkeypatch):
+    monkeypatch.delenv("XDG_CACHE_HOME")
+    with patch(
+        "arcllm.config.Path.home",
+        side_effect=RuntimeError("Could not determine home directory."),
+    ):
+        assert load_provider_config("cached").provider.default_model == "m"
+
+
+def test_config_cache_key_tracks_schema(cached_provider_dir):
+    load_provider_config("cached")
+    with patch("arcllm.config._config_schema_tag", return_value="otherver"):
+        with patch("arcllm.config._load_toml_file", wraps=_load_toml_file) as toml:
+            load_provider_config("cached")
+    toml.assert_called_once()
+    cache_dir = cached_provider_dir / "cache" / "arcllm"
+    assert len(list(cache_dir.glob("cached.*.otherver.json"))) == 1
+
+
 # --- HTTPS enforcement on base_url ---
 
 
@@ -52,3 +52,14 @@ def test_all_exports_are_accessible():
     for name in arcllm.__all__:
         attr = getattr(arcllm, name)
         assert attr is not None, f"{name} resolved to None"
+
+
+def test_adapters_package_lazy_exports():
+    """arcllm.adapters exposes adapter classes without importing them eagerly."""
+    import arcllm.adapters as adapters
+
+    for name in adapters.__all__:
+        assert getattr(adapters, name).__name__ == name
+
+    with pytest.raises(AttributeError, match="no attribute"):
+        _ = adapters.NoSuchAdapter
@@ -5,7 +5,12 @@ import logging
 import pytest
 
 from arcllm.exceptions import ArcLLMConfigError
-from arcllm.modules._logging import _sanitize, log_structured, validate_log_level
+from arcllm.modules._logging import (
+    _sanitize,
+    log_structured,
+    render_fields,
+    validate_log_level,
+)
 
 
 class TestSanitize:
@@ -68,6 +73,13 @@ class TestLogStructured:
             log_structured(test_logger, logging.DEBUG, "Test", key="val")
         assert caplog.text == ""
 
+    def test_prefix_rendered_first(self, caplog):
+        test_logger = logging.getLogger("test.structured")
+        prefix = render_fields(provider="evil\nname", skipped=None)
+        with caplog.at_level(logging.INFO, logger="test.structured"):
+            log_structured(test_logger, logging.INFO, "Test", prefix=prefix, key=1)
+        assert "Test | provider=evil\\nname key=1" in caplog.text
+
 
 class TestValidateLogLevel:
     def test_default_is_info(self):
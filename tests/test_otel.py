@@ -1,5 +1,6 @@
 """Tests for OtelModule — root span creation, GenAI attributes, config validation, SDK setup."""
 
+import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -7,6 +8,8 @@ import pytest
 from arcllm.exceptions import ArcLLMConfigError
 from arcllm.types import LLMResponse, Message, Usage
 
+_HI_MESSAGES = (Message(role="user", content="hi"),)
+
 
 def _make_inner() -> MagicMock:
     """Create a mock inner LLMProvider."""
@@ -25,6 +28,19 @@ def _make_inner() -> MagicMock:
     return inner
 
 
+class _MinimalInner:
+    """Inert inner provider for tests that only construct the module."""
+
+    name = "anthropic"
+    model_name = "claude-sonnet-4-20250514"
+
+    async def invoke(self, *args, **kwargs):
+        raise AssertionError("inner.invoke should not be called")
+
+
+_MIN_INNER = _MinimalInner()
+
+
 def _default_config(**overrides) -> dict:
     """Return a minimal valid OtelModule config."""
     base = {"exporter": "none"}
@@ -35,206 +51,144 @@ def _default_config(**overrides) -> dict:
 class TestOtelModule:
     """Core OtelModule behavior tests."""
 
-    @pytest.mark.asyncio
-    async def test_invoke_delegates_to_inner(self):
-        """Messages are passed through, response returned."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def shared_module(cls):
+        """One exporter='none' module shared by the pure delegation tests."""
         from arcllm.modules.otel import OtelModule
 
         inner = _make_inner()
-        module = OtelModule(_default_config(), inner)
-        messages = [Message(role="user", content="hi")]
+        return OtelModule(_default_config(), inner), inner
+
+    @pytest.fixture(autouse=True)
+    def _reset_inner(self, shared_module):
+        _, inner = shared_module
+        inner.invoke.reset_mock()
+
+    @pytest.mark.asyncio
+    async def test_invoke_delegates_to_inner(self, shared_module):
+        """Messages are passed through, response returned."""
+        module, inner = shared_module
+        messages = list(_HI_MESSAGES)
         response = await module.invoke(messages)
         inner.invoke.assert_awaited_once_with(messages, None)
         assert response.content == "hello"
 
     @pytest.mark.asyncio
-    async def test_invoke_passes_tools_and_kwargs(self):
+    async def test_invoke_passes_tools_and_kwargs(self, shared_module):
         """Tools and kwargs are forwarded to inner."""
-        from arcllm.modules.otel import OtelModule
-
-        inner = _make_inner()
-        module = OtelModule(_default_config(), inner)
-        messages = [Message(role="user", content="hi")]
+        module, inner = shared_module
+        messages = list(_HI_MESSAGES)
         tools = [MagicMock()]
         response = await module.invoke(messages, tools=tools, max_tokens=100)
         inner.invoke.assert_awaited_once_with(messages, tools, max_tokens=100)
 
     @pytest.mark.asyncio
-    async def test_returns_response_unchanged(self):
+    async def test_returns_response_unchanged(self, shared_module):
         """Same object reference returned."""
-        from arcllm.modules.otel import OtelModule
-
-        inner = _make_inner()
+        module, inner = shared_module
         expected = inner.invoke.return_value
-        module = OtelModule(_default_config(), inner)
-        messages = [Message(role="user", content="hi")]
+        messages = list(_HI_MESSAGES)
         response = await module.invoke(messages)
         assert response is expected
 
     @pytest.mark.asyncio
-    async def test_creates_root_span(self):
+    async def test_creates_root_span(self, fake_tracer):
         """A span named 'arcllm.invoke' is created."""
         from arcllm.modules.otel import OtelModule
 
         inner = _make_inner()
         module = OtelModule(_default_config(), inner)
-        mock_tracer = MagicMock()
-        mock_span = MagicMock()
-        mock_tracer.start_as_current_span.return_value.__enter__ = MagicMock(
-            return_value=mock_span
-        )
-        mock_tracer.start_as_current_span.return_value.__exit__ = MagicMock(
-            return_value=False
-        )
-        with patch("arcllm.modules.base.trace.get_tracer", return_value=mock_tracer):
-            messages = [Message(role="user", content="hi")]
-            await module.invoke(messages)
-        # _span is called with "arcllm.invoke"
-        mock_tracer.start_as_current_span.assert_called()
-        call_args = mock_tracer.start_as_current_span.call_args
-        assert call_args[0][0] == "arcllm.invoke"
+        messages = list(_HI_MESSAGES)
+        await module.invoke(messages)
+        assert [s._name for s in fake_tracer.spans] == ["arcllm.invoke"]
 
     @pytest.mark.asyncio
-    async def test_sets_gen_ai_system_attribute(self):
+    async def test_sets_gen_ai_system_attribute(self, fake_tracer):
         """gen_ai.system attribute set to inner.name."""
         from arcllm.modules.otel import OtelModule
 
         inner = _make_inner()
         module = OtelModule(_default_config(), inner)
-        mock_tracer = MagicMock()
-        mock_span = MagicMock()
-        mock_tracer.start_as_current_span.return_value.__enter__ = MagicMock(
-            return_value=mock_span
-        )
-        mock_tracer.start_as_current_span.return_value.__exit__ = MagicMock(
-            return_value=False
-        )
-        with patch("arcllm.modules.base.trace.get_tracer", return_value=mock_tracer):
-            messages = [Message(role="user", content="hi")]
-            await module.invoke(messages)
-        # Check set_attribute calls
-        calls = {c[0][0]: c[0][1] for c in mock_span.set_attribute.call_args_list}
+        messages = list(_HI_MESSAGES)
+        await module.invoke(messages)
+        span = fake_tracer.by_name["arcllm.invoke"][0]
+        calls = {c[0][0]: c[0][1] for c in span.set_attribute.call_args_list}
         assert calls.get("gen_ai.system") == "anthropic"
 
     @pytest.mark.asyncio
-    async def test_sets_gen_ai_request_model(self):
+    async def test_sets_gen_ai_request_model(self, fake_tracer):
         """gen_ai.request.model attribute set to inner.model_name."""
         from arcllm.modules.otel import OtelModule
 
         inner = _make_inner()
         module = OtelModule(_default_config(), inner)
-        mock_tracer = MagicMock()
-        mock_span = MagicMock()
-        mock_tracer.start_as_current_span.return_value.__enter__ = MagicMock(
-            return_value=mock_span
-        )
-        mock_tracer.start_as_current_span.return_value.__exit__ = MagicMock(
-            return_value=False
-        )
-        with patch("arcllm.modules.base.trace.get_tracer", return_value=mock_tracer):
-            messages = [Message(role="user", content="hi")]
-            await module.invoke(messages)
-        calls = {c[0][0]: c[0][1] for c in mock_span.set_attribute.call_args_list}
+        messages = list(_HI_MESSAGES)
+        await module.invoke(messages)
+        span = fake_tracer.by_name["arcllm.invoke"][0]
+        calls = {c[0][0]: c[0][1] for c in span.set_attribute.call_args_list}
         assert calls.get("gen_ai.request.model") == "claude-sonnet-4-20250514"
 
     @pytest.mark.asyncio
-    async def test_sets_gen_ai_usage_input_tokens(self):
+    async def test_sets_gen_ai_usage_input_tokens(self, fake_tracer):
         """gen_ai.usage.input_tokens set from response.usage."""
         from arcllm.modules.otel import OtelModule
 
         inner = _make_inner()
         module = OtelModule(_default_config(), inner)
-        mock_tracer = MagicMock()
-        mock_span = MagicMock()
-        mock_tracer.start_as_current_span.return_value.__enter__ = MagicMock(
-            return_value=mock_span
-        )
-        mock_tracer.start_as_current_span.return_value.__exit__ = MagicMock(
-            return_value=False
-        )
-        with patch("arcllm.modules.base.trace.get_tracer", return_value=mock_tracer):
-            messages = [Message(role="user", content="hi")]
-            await module.invoke(messages)
-        calls = {c[0][0]: c[0][1] for c in mock_span.set_attribute.call_args_list}
+        messages = list(_HI_MESSAGES)
+        await module.invoke(messages)
+        span = fake_tracer.by_name["arcllm.invoke"][0]
+        calls = {c[0][0]: c[0][1] for c in span.set_attribute.call_args_list}
         assert calls.get("gen_ai.usage.input_tokens") == 100
 
     @pytest.mark.asyncio
-    async def test_sets_gen_ai_usage_output_tokens(self):
+    async def test_sets_gen_ai_usage_output_tokens(self, fake_tracer):
         """gen_ai.usage.output_tokens set from response.usage."""
         from arcllm.modules.otel import OtelModule
 
         inner = _make_inner()
         module = OtelModule(_default_config(), inner)
-        mock_tracer = MagicMock()
-        mock_span = MagicMock()
-        mock_tracer.start_as_current_span.return_value.__enter__ = MagicMock(
-            return_value=mock_span
-        )
-        mock_tracer.start_as_current_span.return_value.__exit__ = MagicMock(
-            return_value=False
-        )
-        with patch("arcllm.modules.base.trace.get_tracer", return_value=mock_tracer):
-            messages = [Message(role="user", content="hi")]
-            await module.invoke(messages)
-        calls = {c[0][0]: c[0][1] for c in mock_span.set_attribute.call_args_list}
+        messages = list(_HI_MESSAGES)
+        await module.invoke(messages)
+        span = fake_tracer.by_name["arcllm.invoke"][0]
+        calls = {c[0][0]: c[0][1] for c in span.set_attribute.call_args_list}
         assert calls.get("gen_ai.usage.output_tokens") == 50
 
     @pytest.mark.asyncio
-    async def test_sets_gen_ai_response_model(self):
+    async def test_sets_gen_ai_response_model(self, fake_tracer):
         """gen_ai.response.model set from response.model."""
         from arcllm.modules.otel import OtelModule
 
         inner = _make_inner()
         module = OtelModule(_default_config(), inner)
-        mock_tracer = MagicMock()
-        mock_span = MagicMock()
-        mock_tracer.start_as_current_span.return_value.__enter__ = MagicMock(
-            return_value=mock_span
-        )
-        mock_tracer.start_as_current_span.return_value.__exit__ = MagicMock(
-            return_value=False
-        )
-        with patch("arcllm.modules.base.trace.get_tracer", return_value=mock_tracer):
-            messages = [Message(role="user", content="hi")]
-            await module.invoke(messages)
-        calls = {c[0][0]: c[0][1] for c in mock_span.set_attribute.call_args_list}
+        messages = list(_HI_MESSAGES)
+        await module.invoke(messages)
+        span = fake_tracer.by_name["arcllm.invoke"][0]
+        calls = {c[0][0]: c[0][1] for c in span.set_attribute.call_args_list}
         assert calls.get("gen_ai.response.model") == "claude-sonnet-4-20250514"
 
     @pytest.mark.asyncio
-    async def test_sets_gen_ai_response_finish_reasons(self):
+    async def test_sets_gen_ai_response_finish_reasons(self, fake_tracer):
         """gen_ai.response.finish_reasons set from response.stop_reason."""
         from arcllm.modules.otel import OtelModule
 
         inner = _make_inner()
         module = OtelModule(_default_config(), inner)
-        mock_tracer = MagicMock()
-        mock_span = MagicMock()
-        mock_tracer.start_as_current_span.return_value.__enter__ = MagicMock(
-            return_value=mock_span
-        )
-        mock_tracer.start_as_current_span.return_value.__exit__ = MagicMock(
-            return_value=False
-        )
-        with patch("arcllm.modules.base.trace.get_tracer", return_value=mock_tracer):
-            messages = [Message(role="user", content="hi")]
-            await module.invoke(messages)
-        calls = {c[0][0]: c[0][1] for c in mock_span.set_attribute.call_args_list}
+        messages = list(_HI_MESSAGES)
+        await module.invoke(messages)
+        span = fake_tracer.by_name["arcllm.invoke"][0]
+        calls = {c[0][0]: c[0][1] for c in span.set_attribute.call_args_list}
         assert calls.get("gen_ai.response.finish_reasons") == ["end_turn"]
 
-    def test_provider_name_from_inner(self):
+    def test_provider_name_from_inner(self, shared_module):
         """module.name delegates to inner.name."""
-        from arcllm.modules.otel import OtelModule
-
-        inner = _make_inner()
-        module = OtelModule(_default_config(), inner)
+        module, _ = shared_module
         assert module.name == "anthropic"
 
-    def test_model_name_from_inner(self):
+    def test_model_name_from_inner(self, shared_module):
         """module.model_name delegates to inner.model_name."""
-        from arcllm.modules.otel import OtelModule
-
-        inner = _make_inner()
-        module = OtelModule(_default_config(), inner)
+        module, _ = shared_module
         assert module.model_name == "claude-sonnet-4-20250514"
 
 
@@ -280,133 +234,112 @@ class TestOtelModuleValidation:
                 {"exporter": "none", "bogus_key": "value"}, _make_inner()
             )
 
-    def test_sdk_not_installed_raises_error(self):
+    def test_sdk_not_installed_raises_error(self, monkeypatch):
         """OTel enabled but SDK not installed raises clear error."""
         from arcllm.modules.otel import OtelModule
 
-        with patch.dict("sys.modules", {"opentelemetry.sdk": None}):
-            with pytest.raises(ArcLLMConfigError, match="install"):
-                OtelModule({"exporter": "otlp"}, _make_inner())
+        # Block only the first SDK import _setup_sdk performs — no full
+        # sys.modules snapshot/restore.
+        monkeypatch.setattr("arcllm.modules.otel._sdk_configured", False)
+        monkeypatch.setitem(sys.modules, "opentelemetry.sdk.resources", None)
+        with pytest.raises(ArcLLMConfigError, match="install"):
+            OtelModule({"exporter": "otlp"}, _make_inner())
 
 
 class TestOtelSdkSetup:
     """SDK setup tests — all mocked."""
 
-    def test_otlp_exporter_created(self):
+    @pytest.fixture
+    def mock_setup(self):
+        """Patch _setup_sdk once per test case."""
+        with patch("arcllm.modules.otel._setup_sdk") as mock_setup:
+            yield mock_setup
+
+    def test_otlp_exporter_created(self, mock_setup):
         """OTLP exporter created with endpoint and protocol."""
         from arcllm.modules.otel import OtelModule
 
-        mock_sdk_trace = MagicMock()
-        mock_otlp_grpc = MagicMock()
-        with (
-            patch.dict(
-                "sys.modules",
-                {
-                    "opentelemetry.sdk": MagicMock(),
-                    "opentelemetry.sdk.trace": mock_sdk_trace,
-                    "opentelemetry.sdk.trace.export": MagicMock(),
-                    "opentelemetry.sdk.resources": MagicMock(),
-                    "opentelemetry.exporter.otlp.proto.grpc.trace_exporter": mock_otlp_grpc,
-                },
-            ),
-            patch("arcllm.modules.otel._setup_sdk") as mock_setup,
-        ):
-            module = OtelModule(
-                {
-                    "exporter": "otlp",
-                    "endpoint": "http://collector:4317",
-                    "protocol": "grpc",
-                },
-                _make_inner(),
-            )
-            mock_setup.assert_called_once()
+        OtelModule(
+            {
+                "exporter": "otlp",
+                "endpoint": "http://collector:4317",
+                "protocol": "grpc",
+            },
+            _MIN_INNER,
+        )
+        mock_setup.assert_called_once()
 
-    def test_console_exporter_created(self):
+    def test_console_exporter_created(self, mock_setup):
         """Console exporter used when exporter='console'."""
         from arcllm.modules.otel import OtelModule
 
-        with patch("arcllm.modules.otel._setup_sdk") as mock_setup:
-            module = OtelModule({"exporter": "console"}, _make_inner())
-            mock_setup.assert_called_once()
+        OtelModule({"exporter": "console"}, _MIN_INNER)
+        mock_setup.assert_called_once()
 
-    def test_none_exporter_no_processor(self):
+    def test_none_exporter_no_processor(self, mock_setup):
         """No exporter created when exporter='none'."""
         from arcllm.modules.otel import OtelModule
 
-        with patch("arcllm.modules.otel._setup_sdk") as mock_setup:
-            module = OtelModule({"exporter": "none"}, _make_inner())
-            mock_setup.assert_not_called()
-
-    def test_auth_headers_passed(self):
-        """Headers dict forwarded to exporter setup."""
-        from arcllm.modules.otel import OtelModule
+        OtelModule({"exporter": "none"}, _MIN_INNER)
+        mock_setup.assert_not_called()
 
-        with patch("arcllm.modules.otel._setup_sdk") as mock_setup:
-            module = OtelModule(
+    @pytest.mark.parametrize(
+        "config,key,expected",
+        [
+            (
+                {"exporter": "otlp", "headers": {"Authorization": "Bearer tok"}},
+                "headers",
+                {"Authorization": "Bearer tok"},
+            ),
+            (
+                {"exporter": "otlp", "service_name": "my-agent"},
+                "service_name",
+                "my-agent",
+            ),
+            (
                 {
                     "exporter": "otlp",
-                    "headers": {"Authorization": "Bearer tok"},
+                    "resource_attributes": {
+                        "deployment.environment": "production",
+                        "service.version": "1.0",
+                    },
                 },
-                _make_inner(),
-            )
-            config_arg = mock_setup.call_args[0][0]
-            assert config_arg["headers"] == {"Authorization": "Bearer tok"}
-
-    def test_resource_includes_service_name(self):
-        """service_name passed to SDK setup."""
-        from arcllm.modules.otel import OtelModule
-
-        with patch("arcllm.modules.otel._setup_sdk") as mock_setup:
-            module = OtelModule(
-                {"exporter": "otlp", "service_name": "my-agent"},
-                _make_inner(),
-            )
-            config_arg = mock_setup.call_args[0][0]
-            assert config_arg["service_name"] == "my-agent"
-
-    def test_resource_includes_custom_attributes(self):
-        """resource_attributes passed to SDK setup."""
-        from arcllm.modules.otel import OtelModule
-
-        attrs = {"deployment.environment": "production", "service.version": "1.0"}
-        with patch("arcllm.modules.otel._setup_sdk") as mock_setup:
-            module = OtelModule(
-                {"exporter": "otlp", "resource_attributes": attrs},
-                _make_inner(),
-            )
-            config_arg = mock_setup.call_args[0][0]
-            assert config_arg["resource_attributes"] == attrs
-
-    def test_sampler_uses_sample_rate(self):
-        """sample_rate passed to SDK setup."""
+                "resource_attributes",
+                {"deployment.environment": "production", "service.version": "1.0"},
+            ),
+            (
+                {"exporter": "otlp", "sample_rate": 0.5},
+                "sample_rate",
+                0.5,
+            ),
+        ],
+        ids=["headers", "service_name", "resource_attributes", "sample_rate"],
+    )
+    def test_config_propagated(self, mock_setup, config, key, expected):
+        """Headers, resource, and sampler settings forwarded to SDK setup."""
         from arcllm.modules.otel import OtelModule
 
-        with patch("arcllm.modules.otel._setup_sdk") as mock_setup:
-            module = OtelModule(
-                {"exporter": "otlp", "sample_rate": 0.5},
-                _make_inner(),
-            )
-            config_arg = mock_setup.call_args[0][0]
-            assert config_arg["sample_rate"] == 0.5
+        OtelModule(config, _MIN_INNER)
+        config_arg = mock_setup.call_args[0][0]
+        assert config_arg[key] == expected
 
-    def test_tls_certificates_passed(self):
+    def test_tls_certificates_passed(self, mock_setup):
         """TLS certificate paths forwarded to SDK setup."""
         from arcllm.modules.otel import OtelModule
 
-        with patch("arcllm.modules.otel._setup_sdk") as mock_setup:
-            module = OtelModule(
-                {
-                    "exporter": "otlp",
-                    "certificate_file": "/path/ca.pem",
-                    "client_key_file": "/path/client.key",
-                    "client_cert_file": "/path/client.pem",
-                },
-                _make_inner(),
-            )
-            config_arg = mock_setup.call_args[0][0]
-            assert config_arg["certificate_file"] == "/path/ca.pem"
-            assert config_arg["client_key_file"] == "/path/client.key"
-            assert config_arg["client_cert_file"] == "/path/client.pem"
+        OtelModule(
+            {
+                "exporter": "otlp",
+                "certificate_file": "/path/ca.pem",
+                "client_key_file": "/path/client.key",
+                "client_cert_file": "/path/client.pem",
+            },
+            _MIN_INNER,
+        )
+        config_arg = mock_setup.call_args[0][0]
+        assert config_arg["certificate_file"] == "/path/ca.pem"
+        assert config_arg["client_key_file"] == "/path/client.key"
+        assert config_arg["client_cert_file"] == "/path/client.pem"
 
 
 class TestOtelSdkIdempotency:
@@ -3,12 +3,18 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from opentelemetry.trace import StatusCode
+
+# Skip the whole file once at collection when OpenTelemetry is unavailable.
+StatusCode = pytest.importorskip(
+    "opentelemetry.trace", reason="opentelemetry not installed"
+).StatusCode
 
 from arcllm.exceptions import ArcLLMAPIError
 from arcllm.modules.rate_limit import clear_buckets
 from arcllm.types import LLMResponse, Message, Usage
 
+_HI_MESSAGES = (Message(role="user", content="hi"),)
+
 
 def _make_response(**overrides) -> LLMResponse:
     """Create a mock LLMResponse."""
@@ -23,247 +29,209 @@ def _make_response(**overrides) -> LLMResponse:
     return LLMResponse(**defaults)
 
 
-def _make_inner(response=None, side_effect=None) -> MagicMock:
+class _AsyncStub:
+    """Lean stand-in for ``AsyncMock`` on ``invoke`` — records calls in a list.
+
+    ``side_effect`` may be an exception (raised on every call) or a list of
+    results/exceptions consumed in order, mirroring ``AsyncMock``.
+    """
+
+    def __init__(self, result=None, side_effect=None) -> None:
+        self.calls: list[tuple[tuple, dict]] = []
+        self.result = result
+        self.side_effect = side_effect
+
+    async def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        effect = self.side_effect
+        if isinstance(effect, BaseException):
+            raise effect
+        if effect:
+            value = effect.pop(0)
+            if isinstance(value, BaseException):
+                raise value
+            return value
+        return self.result
+
+
+def _make_inner(response=None) -> MagicMock:
     """Create a mock inner LLMProvider."""
     inner = MagicMock()
     inner.name = "test_provider"
     inner.model_name = "test-model"
-    if side_effect:
-        inner.invoke = AsyncMock(side_effect=side_effect)
-    else:
-        inner.invoke = AsyncMock(return_value=response or _make_response())
+    inner.invoke = _AsyncStub(result=response or _make_response())
     return inner
 
 
-def _make_mock_tracer():
-    """Create a mock tracer and span for assertion."""
-    mock_tracer = MagicMock()
-    spans = []
-
-    def make_span_context(name, attributes=None):
-        span = MagicMock()
-        span._name = name
-        spans.append(span)
-        cm = MagicMock()
-        cm.__enter__ = MagicMock(return_value=span)
-        cm.__exit__ = MagicMock(return_value=False)
-        return cm
-
-    mock_tracer.start_as_current_span = make_span_context
-    return mock_tracer, spans
+@pytest.fixture
+def mock_inner():
+    """Generic inner provider; tests set ``invoke.side_effect`` per scenario."""
+    return _make_inner()
 
 
-@pytest.fixture(autouse=True)
-def _clear_rate_limit_state():
+@pytest.fixture
+def clear_rate_limit_state():
     """Clear rate limit buckets between tests."""
     clear_buckets()
     yield
     clear_buckets()
 
 
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Make retry backoff instant."""
+
+    async def _noop(*args, **kwargs):
+        return None
+
+    monkeypatch.setattr("arcllm.modules.retry.asyncio.sleep", _noop)
+
+
+@pytest.mark.usefixtures("no_sleep")
 class TestRetrySpans:
     """RetryModule span tests."""
 
     @pytest.mark.asyncio
-    async def test_retry_creates_retry_span(self):
+    async def test_retry_creates_retry_span(self, fake_tracer):
         """arcllm.retry span exists."""
         from arcllm.modules.retry import RetryModule
 
         inner = _make_inner()
         module = RetryModule({"max_retries": 1}, inner)
-        mock_tracer, spans = _make_mock_tracer()
-        with patch("arcllm.modules.base.trace.get_tracer", return_value=mock_tracer):
-            messages = [Message(role="user", content="hi")]
-            await module.invoke(messages)
-        span_names = [s._name for s in spans]
-        assert "arcllm.retry" in span_names
-
-    @pytest.mark.asyncio
-    async def test_retry_creates_attempt_spans(self):
-        """arcllm.retry.attempt span created per attempt."""
-        from arcllm.modules.retry import RetryModule
-
-        error = ArcLLMAPIError(429, "rate limited", "test")
-        inner = _make_inner(
-            side_effect=[error, _make_response()]
-        )
-        module = RetryModule(
-            {"max_retries": 2, "backoff_base_seconds": 0.001}, inner
-        )
-        mock_tracer, spans = _make_mock_tracer()
-        with patch("arcllm.modules.base.trace.get_tracer", return_value=mock_tracer):
-            messages = [Message(role="user", content="hi")]
-            await module.invoke(messages)
-        span_names = [s._name for s in spans]
-        assert span_names.count("arcllm.retry.attempt") == 2
+        messages = list(_HI_MESSAGES)
+        await module.invoke(messages)
+        assert "arcllm.retry" in fake_tracer.by_name
 
     @pytest.mark.asyncio
-    async def test_retry_records_exception_on_failed_attempt(self):
-        """Exception event recorded on failed attempt span."""
+    async def test_retry_attempt_spans(self, mock_inner, fake_tracer):
+        """One attempt span per try; the handled failure is recorded with OK status."""
         from arcllm.modules.retry import RetryModule
 
         error = ArcLLMAPIError(429, "rate limited", "test")
-        inner = _make_inner(
-            side_effect=[error, _make_response()]
-        )
-        module = RetryModule(
-            {"max_retries": 2, "backoff_base_seconds": 0.001}, inner
-        )
-        mock_tracer, spans = _make_mock_tracer()
-        with patch("arcllm.modules.base.trace.get_tracer", return_value=mock_tracer):
-            messages = [Message(role="user", content="hi")]
-            await module.invoke(messages)
+        mock_inner.invoke.side_effect = [error, _make_response()]
+        module = RetryModule({"max_retries": 2}, mock_inner)
+        messages = list(_HI_MESSAGES)
+        await module.invoke(messages)
+        attempt_spans = fake_tracer.by_name["arcllm.retry.attempt"]
+        assert len(attempt_spans) == 2
         # First attempt span should have exception recorded
-        attempt_spans = [s for s in spans if s._name == "arcllm.retry.attempt"]
         attempt_spans[0].record_exception.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_retry_attempt_ok_when_handled(self):
-        """StatusCode.OK on retried attempt (error was handled)."""
-        from arcllm.modules.retry import RetryModule
-
-        error = ArcLLMAPIError(429, "rate limited", "test")
-        inner = _make_inner(
-            side_effect=[error, _make_response()]
-        )
-        module = RetryModule(
-            {"max_retries": 2, "backoff_base_seconds": 0.001}, inner
-        )
-        mock_tracer, spans = _make_mock_tracer()
-        with patch("arcllm.modules.base.trace.get_tracer", return_value=mock_tracer):
-            messages = [Message(role="user", content="hi")]
-            await module.invoke(messages)
-        attempt_spans = [s for s in spans if s._name == "arcllm.retry.attempt"]
+        # Error was handled by the retry, so the attempt is not marked ERROR
         attempt_spans[0].set_status.assert_called_with(StatusCode.OK)
 
     @pytest.mark.asyncio
-    async def test_retry_error_on_exhaustion(self):
+    async def test_retry_error_on_exhaustion(self, mock_inner, fake_tracer):
         """StatusCode.ERROR when all retries fail."""
         from arcllm.modules.retry import RetryModule
 
         error = ArcLLMAPIError(429, "rate limited", "test")
-        inner = _make_inner(side_effect=[error, error])
-        module = RetryModule(
-            {"max_retries": 1, "backoff_base_seconds": 0.001}, inner
-        )
-        mock_tracer, spans = _make_mock_tracer()
-        with patch("arcllm.modules.base.trace.get_tracer", return_value=mock_tracer):
-            messages = [Message(role="user", content="hi")]
-            with pytest.raises(ArcLLMAPIError):
-                await module.invoke(messages)
-        retry_span = next(s for s in spans if s._name == "arcllm.retry")
+        mock_inner.invoke.side_effect = [error, error]
+        module = RetryModule({"max_retries": 1}, mock_inner)
+        messages = list(_HI_MESSAGES)
+        with pytest.raises(ArcLLMAPIError):
+            await module.invoke(messages)
+        retry_span = fake_tracer.by_name["arcllm.retry"][0]
         # set_status now includes error description from _span()
         call_args = retry_span.set_status.call_args
         assert call_args[0][0] == StatusCode.ERROR
 
 
+@pytest.fixture
+def fallback_env(monkeypatch, fake_tracer):
+    """Fake tracer plus a stubbed fallback load_model in one step."""
+    fallback_provider = _make_inner()
+    fallback_provider.close = AsyncMock()
+    monkeypatch.setattr(
+        "arcllm.modules.fallback.load_model", lambda *a, **k: fallback_provider
+    )
+    return fake_tracer, fallback_provider
+
+
 class TestFallbackSpans:
     """FallbackModule span tests."""
 
     @pytest.mark.asyncio
-    async def test_fallback_creates_fallback_span(self):
+    async def test_fallback_creates_fallback_span(self, fallback_env):
         """arcllm.fallback span exists."""
         from arcllm.modules.fallback import FallbackModule
 
+        fake_tracer, _ = fallback_env
         inner = _make_inner()
         module = FallbackModule({"chain": []}, inner)
-        mock_tracer, spans = _make_mock_tracer()
-        with patch("arcllm.modules.base.trace.get_tracer", return_value=mock_tracer):
-            messages = [Message(role="user", content="hi")]
-            await module.invoke(messages)
-        span_names = [s._name for s in spans]
-        assert "arcllm.fallback" in span_names
+        messages = list(_HI_MESSAGES)
+        await module.invoke(messages)
+        assert "arcllm.fallback" in fake_tracer.by_name
 
     @pytest.mark.asyncio
-    async def test_fallback_creates_provider_spans(self):
+    async def test_fallback_creates_provider_spans(self, mock_inner, fallback_env):
         """Per-provider child spans created during fallback."""
         from arcllm.modules.fallback import FallbackModule
 
-        inner = _make_inner(side_effect=RuntimeError("primary fail"))
-        fallback_provider = _make_inner()
-        fallback_provider.close = AsyncMock()
-        module = FallbackModule({"chain": ["backup"]}, inner)
-        mock_tracer, spans = _make_mock_tracer()
-        with (
-            patch("arcllm.modules.base.trace.get_tracer", return_value=mock_tracer),
-            patch(
-                "arcllm.modules.fallback.load_model", return_value=fallback_provider
-            ),
-        ):
-            messages = [Message(role="user", content="hi")]
-            await module.invoke(messages)
-        span_names = [s._name for s in spans]
-        assert "arcllm.fallback.attempt" in span_names
+        fake_tracer, _ = fallback_env
+        mock_inner.invoke.side_effect = RuntimeError("primary fail")
+        module = FallbackModule({"chain": ["backup"]}, mock_inner)
+        messages = list(_HI_MESSAGES)
+        await module.invoke(messages)
+        assert "arcllm.fallback.attempt" in fake_tracer.by_name
 
     @pytest.mark.asyncio
-    async def test_fallback_primary_failed_event(self):
+    async def test_fallback_primary_failed_event(self, mock_inner, fallback_env):
         """Event recorded when primary fails."""
         from arcllm.modules.fallback import FallbackModule
 
-        inner = _make_inner(side_effect=RuntimeError("primary fail"))
-        fallback_provider = _make_inner()
-        fallback_provider.close = AsyncMock()
-        module = FallbackModule({"chain": ["backup"]}, inner)
-        mock_tracer, spans = _make_mock_tracer()
-        with (
-            patch("arcllm.modules.base.trace.get_tracer", return_value=mock_tracer),
-            patch(
-                "arcllm.modules.fallback.load_model", return_value=fallback_provider
-            ),
-        ):
-            messages = [Message(role="user", content="hi")]
-            await module.invoke(messages)
-        fallback_span = next(s for s in spans if s._name == "arcllm.fallback")
+        fake_tracer, _ = fallback_env
+        mock_inner.invoke.side_effect = RuntimeError("primary fail")
+        module = FallbackModule({"chain": ["backup"]}, mock_inner)
+        messages = list(_HI_MESSAGES)
+        await module.invoke(messages)
+        fallback_span = fake_tracer.by_name["arcllm.fallback"][0]
         fallback_span.add_event.assert_called()
 
 
+@pytest.mark.usefixtures("clear_rate_limit_state")
 class TestRateLimitSpans:
     """RateLimitModule span tests."""
 
     @pytest.mark.asyncio
-    async def test_rate_limit_creates_span(self):
+    async def test_rate_limit_creates_span(self, fake_tracer):
         """arcllm.rate_limit span exists."""
         from arcllm.modules.rate_limit import RateLimitModule
 
         inner = _make_inner()
         module = RateLimitModule({"requests_per_minute": 60}, inner)
-        mock_tracer, spans = _make_mock_tracer()
-        with patch("arcllm.modules.base.trace.get_tracer", return_value=mock_tracer):
-            messages = [Message(role="user", content="hi")]
-            await module.invoke(messages)
-        span_names = [s._name for s in spans]
-        assert "arcllm.rate_limit" in span_names
+        messages = list(_HI_MESSAGES)
+        await module.invoke(messages)
+        assert "arcllm.rate_limit" in fake_tracer.by_name
 
     @pytest.mark.asyncio
-    async def test_rate_limit_records_wait_ms(self):
+    async def test_rate_limit_records_wait_ms(self, fake_tracer):
         """arcllm.rate_limit.wait_ms attribute set."""
         from arcllm.modules.rate_limit import RateLimitModule
 
         inner = _make_inner()
         module = RateLimitModule({"requests_per_minute": 60}, inner)
-        mock_tracer, spans = _make_mock_tracer()
-        with patch("arcllm.modules.base.trace.get_tracer", return_value=mock_tracer):
-            messages = [Message(role="user", content="hi")]
-            await module.invoke(messages)
-        rl_span = next(s for s in spans if s._name == "arcllm.rate_limit")
-        rl_span.set_attribute.assert_any_call("arcllm.rate_limit.wait_ms", pytest.approx(0.0, abs=100))
+        messages = list(_HI_MESSAGES)
+        await module.invoke(messages)
+        rl_span = fake_tracer.by_name["arcllm.rate_limit"][0]
+        wait_calls = [
+            c.args[1]
+            for c in rl_span.set_attribute.call_args_list
+            if c.args[0] == "arcllm.rate_limit.wait_ms"
+        ]
+        assert wait_calls and 0 <= wait_calls[0] <= 100
 
     @pytest.mark.asyncio
-    async def test_rate_limit_throttled_event(self):
+    async def test_rate_limit_throttled_event(self, fake_tracer):
         """Event recorded when throttled (wait > 0)."""
         from arcllm.modules.rate_limit import RateLimitModule, TokenBucket
 
         inner = _make_inner()
         module = RateLimitModule({"requests_per_minute": 60}, inner)
         # Force the bucket to return non-zero wait
-        with patch.object(module._bucket, "acquire", return_value=0.5):
-            mock_tracer, spans = _make_mock_tracer()
-            with patch(
-                "arcllm.modules.base.trace.get_tracer", return_value=mock_tracer
-            ):
-                messages = [Message(role="user", content="hi")]
-                await module.invoke(messages)
-        rl_span = next(s for s in spans if s._name == "arcllm.rate_limit")
+        with patch.object(TokenBucket, "acquire", return_value=0.5):
+            messages = list(_HI_MESSAGES)
+            await module.invoke(messages)
+        rl_span = fake_tracer.by_name["arcllm.rate_limit"][0]
         rl_span.add_event.assert_called()
 
 
@@ -271,21 +239,18 @@ class TestTelemetrySpans:
     """TelemetryModule span tests."""
 
     @pytest.mark.asyncio
-    async def test_telemetry_creates_span(self):
+    async def test_telemetry_creates_span(self, fake_tracer):
         """arcllm.telemetry span exists."""
         from arcllm.modules.telemetry import TelemetryModule
 
         inner = _make_inner()
         module = TelemetryModule({}, inner)
-        mock_tracer, spans = _make_mock_tracer()
-        with patch("arcllm.modules.base.trace.get_tracer", return_value=mock_tracer):
-            messages = [Message(role="user", content="hi")]
-            await module.invoke(messages)
-        span_names = [s._name for s in spans]
-        assert "arcllm.telemetry" in span_names
+        messages = list(_HI_MESSAGES)
+        await module.invoke(messages)
+        assert "arcllm.telemetry" in fake_tracer.by_name
 
     @pytest.mark.asyncio
-    async def test_telemetry_records_duration_and_cost(self):
+    async def test_telemetry_records_duration_and_cost(self, fake_tracer):
         """duration_ms and cost_usd attributes set on span."""
         from arcllm.modules.telemetry import TelemetryModule
 
@@ -293,11 +258,9 @@ class TestTelemetrySpans:
         module = TelemetryModule(
             {"cost_input_per_1m": 3.0, "cost_output_per_1m": 15.0}, inner
         )
-        mock_tracer, spans = _make_mock_tracer()
-        with patch("arcllm.modules.base.trace.get_tracer", return_value=mock_tracer):
-            messages = [Message(role="user", content="hi")]
-            await module.invoke(messages)
-        tel_span = next(s for s in spans if s._name == "arcllm.telemetry")
+        messages = list(_HI_MESSAGES)
+        await module.invoke(messages)
+        tel_span = fake_tracer.by_name["arcllm.telemetry"][0]
         attr_calls = {c[0][0]: c[0][1] for c in tel_span.set_attribute.call_args_list}
         assert "arcllm.telemetry.duration_ms" in attr_calls
         assert "arcllm.telemetry.cost_usd" in attr_calls
@@ -307,31 +270,26 @@ class TestAuditSpans:
     """AuditModule span tests."""
 
     @pytest.mark.asyncio
-    async def test_audit_creates_span(self):
+    async def test_audit_creates_span(self, fake_tracer):
         """arcllm.audit span exists."""
         from arcllm.modules.audit import AuditModule
 
         inner = _make_inner()
         module = AuditModule({}, inner)
-        mock_tracer, spans = _make_mock_tracer()
-        with patch("arcllm.modules.base.trace.get_tracer", return_value=mock_tracer):
-            messages = [Message(role="user", content="hi")]
-            await module.invoke(messages)
-        span_names = [s._name for s in spans]
-        assert "arcllm.audit" in span_names
+        messages = list(_HI_MESSAGES)
+        await module.invoke(messages)
+        assert "arcllm.audit" in fake_tracer.by_name
 
     @pytest.mark.asyncio
-    async def test_audit_records_metadata(self):
+    async def test_audit_records_metadata(self, fake_tracer):
         """message_count and content_length attributes set on span."""
         from arcllm.modules.audit import AuditModule
 
         inner = _make_inner()
         module = AuditModule({}, inner)
-        mock_tracer, spans = _make_mock_tracer()
-        with patch("arcllm.modules.base.trace.get_tracer", return_value=mock_tracer):
-            messages = [Message(role="user", content="hi")]
-            await module.invoke(messages)
-        audit_span = next(s for s in spans if s._name == "arcllm.audit")
+        messages = list(_HI_MESSAGES)
+        await module.invoke(messages)
+        audit_span = fake_tracer.by_name["arcllm.audit"][0]
         attr_calls = {
             c[0][0]: c[0][1] for c in audit_span.set_attribute.call_args_list
         }
@@ -1,13 +1,24 @@
 """Tests for PII detection and redaction."""
 
+from unittest.mock import patch
+
 import pytest
 
-from arcllm._pii import PiiMatch, RegexPiiDetector, redact_text
+from arcllm._pii import (
+    HyperscanPiiDetector,
+    PiiMatch,
+    PiiMatches,
+    RegexPiiDetector,
+    _compile_checked,
+    default_detector,
+    redact_text,
+    redact_text_bulk,
+)
 from arcllm.exceptions import ArcLLMConfigError
 
 
 # ---------------------------------------------------------------------------
-# PiiMatch dataclass
+# PiiMatch
 # ---------------------------------------------------------------------------
 
 
@@ -24,6 +35,11 @@ class TestPiiMatch:
         b = PiiMatch(pii_type="SSN", start=0, end=11, matched_text="123-45-6789")
         assert a == b
 
+    def test_pii_match_immutable(self):
+        match = PiiMatch(pii_type="SSN", start=0, end=11, matched_text="123-45-6789")
+        with pytest.raises(AttributeError):
+            match.start = 5
+
 
 # ---------------------------------------------------------------------------
 # RegexPiiDetector — SSN
@@ -75,6 +91,21 @@ class TestDetectCreditCard:
         cc_matches = [m for m in matches if m.pii_type == "CREDIT_CARD"]
         assert len(cc_matches) == 1
 
+    def test_rejects_luhn_invalid_number(self):
+        detector = RegexPiiDetector()
+        matches = detector.detect("Order: 4111 1111 1111 1112")
+        assert [m for m in matches if m.pii_type == "CREDIT_CARD"] == []
+
+    def test_luhn_check_accepts_str_and_bytes(self):
+        from arcllm._pii import _luhn_valid
+
+        # 15-digit Amex test number exercises the odd-length case.
+        for number in ("4111 1111 1111 1111", "3782-822463-10005"):
+            assert _luhn_valid(number)
+            assert _luhn_valid(number.encode())
+        assert not _luhn_valid("4111 1111 1111 1112")
+        assert not _luhn_valid(b"3782-822463-10006")
+
 
 # ---------------------------------------------------------------------------
 # RegexPiiDetector — Email
@@ -164,6 +195,47 @@ class TestNoFalsePositives:
         matches = detector.detect("")
         assert len(matches) == 0
 
+    def test_non_ascii_digits_not_matched(self):
+        detector = RegexPiiDetector()
+        # Arabic-Indic digits in SSN layout
+        text = "\u0661\u0662\u0663-\u0664\u0665-\u0666\u0667\u0668\u0669"
+        assert detector.detect(text) == []
+
+    def test_text_without_digit_or_at_skips_scan(self):
+        detector = RegexPiiDetector()
+        with patch.object(RegexPiiDetector, "_scan") as mock_scan:
+            assert detector.detect("no digits or at-signs here") == []
+        mock_scan.assert_not_called()
+
+    def test_short_text_skips_scan(self):
+        detector = RegexPiiDetector()
+        with patch.object(RegexPiiDetector, "_scan") as mock_scan:
+            assert detector.detect("id 42") == []
+        mock_scan.assert_not_called()
+        assert [m.pii_type for m in detector.detect("a@b.cc")] == ["EMAIL"]
+
+    def test_min_len_is_shortest_builtin_match(self):
+        import re._parser
+
+        from arcllm._pii import _BUILTIN_MIN_LEN, _BUILTIN_PATTERNS
+
+        widths = [re._parser.parse(p).getwidth()[0] for _, p in _BUILTIN_PATTERNS]
+        assert _BUILTIN_MIN_LEN == min(widths)
+
+    def test_custom_patterns_disable_length_guard(self):
+        detector = RegexPiiDetector(
+            custom_patterns=[{"name": "TAG", "pattern": r"\bX\b"}]
+        )
+        assert [m.pii_type for m in detector.detect("X")] == ["TAG"]
+
+    def test_custom_patterns_disable_trigger_prefilter(self):
+        detector = RegexPiiDetector(
+            custom_patterns=[{"name": "CODENAME", "pattern": r"\bBLUEBIRD\b"}]
+        )
+        assert [m.pii_type for m in detector.detect("Project BLUEBIRD")] == [
+            "CODENAME"
+        ]
+
 
 # ---------------------------------------------------------------------------
 # Custom patterns
@@ -189,10 +261,307 @@ class TestCustomPatterns:
         assert "EMPLOYEE_ID" in types
         assert "EMAIL" in types
 
+    def test_longer_custom_match_wins_over_builtin(self):
+        """Same start position: the longer match wins regardless of pattern order."""
+        detector = RegexPiiDetector(
+            custom_patterns=[{"name": "ACCOUNT", "pattern": r"\d{3}-\d{2}-\d{4}-\d{2}"}]
+        )
+        matches = detector.detect("Acct 123-45-6789-01 on file")
+        assert len(matches) == 1
+        assert matches[0].pii_type == "ACCOUNT"
+        assert matches[0].matched_text == "123-45-6789-01"
+
+    def test_same_patterns_share_compiled_set(self):
+        custom = [{"name": "EMPLOYEE_ID", "pattern": r"EMP-\d{6}"}]
+        a = RegexPiiDetector(custom_patterns=custom)
+        b = RegexPiiDetector(custom_patterns=list(custom))
+        assert a._std is b._std
+        assert RegexPiiDetector()._std is default_detector()._std
+
+    def test_default_detector_is_shared(self):
+        assert default_detector() is default_detector()
+
     def test_invalid_custom_regex_raises(self):
         with pytest.raises(ArcLLMConfigError, match="Invalid regex"):
             RegexPiiDetector(custom_patterns=[{"name": "BAD", "pattern": r"[invalid"}])
 
+    def test_custom_pattern_with_leading_inline_flags(self):
+        detector = RegexPiiDetector(
+            custom_patterns=[{"name": "SECRET", "pattern": r"(?i)secret-\d+"}]
+        )
+        assert detector.redact("token SECRET-42, ssn 123-45-6789") == (
+            "token [PII:SECRET], ssn [PII:SSN]"
+        )
+
+    def test_numbered_group_reference_rejected(self):
+        with pytest.raises(ArcLLMConfigError, match="refers to a group by number"):
+            RegexPiiDetector(
+                custom_patterns=[{"name": "REPEAT", "pattern": r"(\d)\1\1"}]
+            )
+
+    def test_named_group_reference_matches(self):
+        detector = RegexPiiDetector(
+            custom_patterns=[{"name": "REPEAT", "pattern": r"(?P<d>\d)(?P=d)(?P=d)"}]
+        )
+        assert [m.matched_text for m in detector.detect("pin 777")] == ["777"]
+
+    def test_conflicting_group_names_raise_config_error(self):
+        with pytest.raises(ArcLLMConfigError, match="cannot be combined"):
+            RegexPiiDetector(
+                custom_patterns=[
+                    {"name": "A", "pattern": r"(?P<g>AAA)"},
+                    {"name": "B", "pattern": r"(?P<g>BBB)"},
+                ]
+            )
+
+    def test_custom_pattern_with_named_group(self):
+        detector = RegexPiiDetector(
+            custom_patterns=[{"name": "TICKET", "pattern": r"(?P<prefix>TKT)-\d{4}"}]
+        )
+        matches = detector.detect("see TKT-1234")
+        assert [(m.pii_type, m.matched_text) for m in matches] == [
+            ("TICKET", "TKT-1234")
+        ]
+
+    def test_detect_types_filter(self):
+        detector = RegexPiiDetector(
+            custom_patterns=[{"name": "EMPLOYEE_ID", "pattern": r"EMP-\d{6}"}]
+        )
+        text = "EMP-123456 SSN 123-45-6789 user@test.com"
+        only = detector.detect(text, types={"SSN", "EMPLOYEE_ID"})
+        assert [m.pii_type for m in only] == ["EMPLOYEE_ID", "SSN"]
+        assert only == [
+            m for m in detector.detect(text) if m.pii_type in {"SSN", "EMPLOYEE_ID"}
+        ]
+        assert detector.detect(text, types={"UNKNOWN"}) == []
+
+    def test_shared_custom_pattern_validated_once(self):
+        pattern = r"EMP-\d{6}"
+        RegexPiiDetector(custom_patterns=[{"name": "EMPLOYEE_ID", "pattern": pattern}])
+        before = _compile_checked.cache_info().hits
+        RegexPiiDetector(
+            custom_patterns=[
+                {"name": "EMPLOYEE_ID", "pattern": pattern},
+                {"name": "CASE", "pattern": r"CASE-\d{4}"},
+            ]
+        )
+        assert _compile_checked.cache_info().hits > before
+
+
+# ---------------------------------------------------------------------------
+# RE2 engine (optional)
+# ---------------------------------------------------------------------------
+
+
+class TestRe2Engine:
+    def test_re2_matches_stdlib_engine(self):
+        pytest.importorskip("re2")
+        detector = RegexPiiDetector(
+            custom_patterns=[{"name": "EMPLOYEE_ID", "pattern": r"EMP-\d{6}"}]
+        )
+        assert detector._re2 is not None
+        text = (
+            "EMP-123456 at 192.168.1.100, SSN 123-45-6789, "
+            "card 4111 1111 1111 1111, call (555) 123-4567, user@test.com"
+        )
+        assert list(detector._spans(text)) == list(
+            detector._scan(detector._std, detector._types, text)
+        )
+
+    @pytest.mark.parametrize("sep", list("\t\n\v\f\r\x1c\x1d\x1e\x1f "))
+    def test_re2_separators_match_stdlib_engine(self, sep):
+        pytest.importorskip("re2")
+        detector = RegexPiiDetector()
+        assert detector._re2 is not None
+        text = f"card 4111{sep}1111{sep}1111{sep}1111, call 555{sep}123{sep}4567"
+        spans = list(detector._spans(text))
+        assert spans == list(detector._scan(detector._std, detector._types, text))
+        assert [name for name, _, _ in spans] == ["CREDIT_CARD", "PHONE"]
+
+    def test_re2_incompatible_custom_pattern_uses_stdlib(self):
+        detector = RegexPiiDetector(
+            custom_patterns=[{"name": "TAGGED", "pattern": r"(?<=id:)\d+"}]
+        )
+        assert detector._re2 is None
+        matches = detector.detect("id:4242")
+        assert [m.pii_type for m in matches] == ["TAGGED"]
+
+
+# ---------------------------------------------------------------------------
+# Bytes scan for ASCII text
+# ---------------------------------------------------------------------------
+
+
+class TestAsciiBytesScan:
+    _TEXT = (
+        "EMP-123456 at 192.168.1.100, SSN 123-45-6789, "
+        "card 4111 1111 1111 1111, call (555) 123-4567, user@test.com"
+    )
+
+    def test_bytes_set_matches_str_set(self):
+        detector = RegexPiiDetector(
+            custom_patterns=[{"name": "EMPLOYEE_ID", "pattern": r"EMP-\d{6}"}]
+        )
+        assert detector._std_bytes is not None
+        names = detector._types
+        assert list(
+            detector._scan(detector._std_bytes, names, self._TEXT.encode("ascii"))
+        ) == list(detector._scan(detector._std, names, self._TEXT))
+
+    @pytest.mark.parametrize("sep", list("\t\n\v\f\r\x1c\x1d\x1e\x1f "))
+    def test_bytes_separators_match_str_set(self, sep):
+        detector = RegexPiiDetector()
+        names = detector._types
+        text = f"card 4111{sep}1111{sep}1111{sep}1111, call 555{sep}123{sep}4567"
+        spans = list(detector._scan(detector._std_bytes, names, text.encode("ascii")))
+        assert spans == list(detector._scan(detector._std, names, text))
+        assert [name for name, _, _ in spans] == ["CREDIT_CARD", "PHONE"]
+
+    def test_ascii_text_without_re2_uses_bytes_set(self):
+        detector = RegexPiiDetector()
+        expected = detector.detect(self._TEXT)
+        detector._re2 = None
+        detector._std = None  # Any str-set scan would now fail
+        assert detector.detect(self._TEXT) == expected
+
+    def test_non_ascii_pattern_has_no_bytes_set(self):
+        detector = RegexPiiDetector(
+            custom_patterns=[{"name": "DASHED", "pattern": "ID\u2014[0-9]+"}]
+        )
+        assert detector._std_bytes is None
+        assert [m.pii_type for m in detector.detect("ID\u201442")] == ["DASHED"]
+
+    def test_str_only_syntax_has_no_bytes_set(self):
+        detector = RegexPiiDetector(
+            custom_patterns=[{"name": "DASHED", "pattern": r"ID\N{EM DASH}[0-9]+"}]
+        )
+        assert detector._std_bytes is None
+
+
+# ---------------------------------------------------------------------------
+# Match timeout (optional regex engine)
+# ---------------------------------------------------------------------------
+
+
+class TestMatchTimeout:
+    def test_backtracking_pattern_times_out(self):
+        pytest.importorskip("regex")
+        detector = RegexPiiDetector(
+            custom_patterns=[{"name": "SLOW", "pattern": r"(a|aa)+$"}],
+            match_timeout=0.05,
+        )
+        # Non-ASCII text keeps the scan off RE2 and on the backtracking engine
+        with pytest.raises(ArcLLMConfigError, match="pii_match_timeout"):
+            detector.detect("\u00e9" + "a" * 40 + "!")
+
+    def test_timeout_keeps_results(self):
+        pytest.importorskip("regex")
+        detector = RegexPiiDetector(match_timeout=1.0)
+        text = "caf\u00e9 SSN 123-45-6789"
+        assert detector.detect(text) == RegexPiiDetector().detect(text)
+
+    def test_non_positive_timeout_raises(self):
+        with pytest.raises(ArcLLMConfigError, match="must be > 0"):
+            RegexPiiDetector(match_timeout=0)
+
+    def test_missing_regex_raises(self, monkeypatch):
+        monkeypatch.setattr("arcllm._pii._regex", None)
+        with pytest.raises(ArcLLMConfigError, match=r"arcllm\[regex\]"):
+            RegexPiiDetector(match_timeout=0.1)
+
+
+# ---------------------------------------------------------------------------
+# Hyperscan prefilter (optional)
+# ---------------------------------------------------------------------------
+
+
+class TestHyperscanEngine:
+    def test_hyperscan_backend_parity(self):
+        pytest.importorskip("hyperscan")
+        custom = [{"name": "EMPLOYEE_ID", "pattern": r"EMP-\d{6}"}]
+        regex = RegexPiiDetector(custom_patterns=custom)
+        fast = HyperscanPiiDetector(custom_patterns=custom)
+        assert fast._hs is not None
+        for text in (
+            "EMP-123456 at 192.168.1.100, SSN 123-45-6789, "
+            "card 4111 1111 1111 1111, call (555) 123-4567, user@test.com",
+            "Nothing sensitive in this sentence.",
+            "caf\u00e9 user@test.com",
+        ):
+            assert fast.detect(text) == regex.detect(text)
+
+    def test_hyperscan_incompatible_pattern_uses_regex(self):
+        pytest.importorskip("hyperscan")
+        detector = HyperscanPiiDetector(
+            custom_patterns=[{"name": "TAGGED", "pattern": r"(?<=id:)\d+"}]
+        )
+        assert detector._hs is None
+        assert [m.pii_type for m in detector.detect("id:4242")] == ["TAGGED"]
+
+    def test_missing_hyperscan_raises(self, monkeypatch):
+        monkeypatch.setattr("arcllm._pii._hyperscan", None)
+        with pytest.raises(ArcLLMConfigError, match="fast-pii"):
+            HyperscanPiiDetector()
+
+
+# ---------------------------------------------------------------------------
+# Batched detection
+# ---------------------------------------------------------------------------
+
+
+class TestDetectMany:
+    _TEXTS = [
+        "SSN 123-45-6789",
+        "",
+        "user@test.com",
+        "nothing here",
+        "4111 1111 1111 1111 and 10.0.0.1",
+    ]
+
+    def test_detect_many_equals_per_message_detect(self):
+        detector = RegexPiiDetector()
+        assert detector.detect_many(self._TEXTS) == [
+            detector.detect(text) for text in self._TEXTS
+        ]
+
+    def test_detect_many_with_custom_patterns(self):
+        detector = RegexPiiDetector(
+            custom_patterns=[{"name": "ANY", "pattern": r"x[^y]x"}]
+        )
+        texts = ["ax", "xb"]
+        assert detector.detect_many(texts) == [[], []]
+
+    def test_detect_many_empty(self):
+        assert RegexPiiDetector().detect_many([]) == []
+
+
+# ---------------------------------------------------------------------------
+# Column-oriented results
+# ---------------------------------------------------------------------------
+
+
+class TestDetectBulk:
+    _TEXT = "Email user@test.com, SSN 123-45-6789, IP 10.0.0.1"
+
+    def test_bulk_matches_detect(self):
+        detector = RegexPiiDetector()
+        bulk = detector.detect_bulk(self._TEXT)
+        assert isinstance(bulk, PiiMatches)
+        assert len(bulk) == 3
+        assert bulk.pii_types == ["EMAIL", "SSN", "IPV4"]
+        assert bulk.to_list() == detector.detect(self._TEXT)
+
+    def test_bulk_empty_text(self):
+        bulk = RegexPiiDetector().detect_bulk("")
+        assert len(bulk) == 0
+        assert redact_text_bulk("", bulk) == ""
+
+    def test_redact_text_bulk_matches_redact_text(self):
+        detector = RegexPiiDetector()
+        bulk = detector.detect_bulk(self._TEXT)
+        expected = redact_text(self._TEXT, detector.detect(self._TEXT))
+        assert redact_text_bulk(self._TEXT, bulk) == expected
+
 
 # ---------------------------------------------------------------------------
 # redact_text
@@ -226,6 +595,25 @@ class TestRedactText:
         result = redact_text("before 123-45-6789 after", matches)
         assert result == "before [PII:SSN] after"
 
+    def test_redact_unsorted_matches(self):
+        text = "a 123-45-6789 b user@test.com c"
+        matches = RegexPiiDetector().detect(text)
+        assert redact_text(text, matches[::-1]) == redact_text(text, matches)
+
+    def test_detector_redact(self):
+        detector = RegexPiiDetector()
+        text = "Email user@test.com, SSN 123-45-6789"
+        assert detector.redact(text) == "Email [PII:EMAIL], SSN [PII:SSN]"
+
+    def test_detector_redact_matches_redact_text(self):
+        detector = RegexPiiDetector()
+        text = "a 123-45-6789 b user@test.com c 4111111111111111 d 10.0.0.1"
+        assert detector.redact(text) == redact_text(text, detector.detect(text))
+
+    def test_detector_redact_without_pii_returns_input(self):
+        text = "nothing sensitive here"
+        assert RegexPiiDetector().redact(text) is text
+
 
 # ---------------------------------------------------------------------------
 # Protocol conformance
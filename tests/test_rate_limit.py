@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import time
+from dataclasses import dataclass, field
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -14,7 +15,7 @@ from arcllm.modules.rate_limit import (
     _bucket_registry,
     clear_buckets,
 )
-from arcllm.types import LLMProvider, LLMResponse, Message, Usage
+from arcllm.types import LLMResponse, Message, Usage
 
 _OK_RESPONSE = LLMResponse(
     content="ok",
@@ -24,21 +25,30 @@ _OK_RESPONSE = LLMResponse(
 )
 
 
-def _make_inner(name: str = "test-provider"):
-    inner = MagicMock(spec=LLMProvider)
-    inner.name = name
-    inner.model_name = "test-model"
-    inner.validate_config.return_value = True
-    inner.invoke = AsyncMock(return_value=_OK_RESPONSE)
-    return inner
+@dataclass
+class _FakeProvider:
+    """Plain stand-in for an LLMProvider; only ``invoke`` is a mock."""
 
+    name: str = "test-provider"
+    model_name: str = "test-model"
+    invoke: AsyncMock = field(
+        default_factory=lambda: AsyncMock(return_value=_OK_RESPONSE)
+    )
 
-def _freeze_then_advance(start: float, step: float = 1.0):
-    """Mock side_effect for time.monotonic(): freeze on first call, then advance.
+    def validate_config(self) -> bool:
+        return True
+
+
+def _make_inner(name: str = "test-provider") -> _FakeProvider:
+    return _FakeProvider(name=name)
+
+
+def _freeze_then_advance(start: int, step: int = 1_000_000_000):
+    """Mock side_effect for time.monotonic_ns(): freeze on first call, then advance.
 
     Returns *start* on the first call (simulating zero elapsed time during the
-    initial refill check inside the lock), then advances by *step* on each
-    subsequent call so the post-sleep refill sees enough elapsed time.
+    initial refill check), then advances by *step* nanoseconds on each
+    subsequent call.
     """
     state = {"calls": 0, "t": start}
 
@@ -75,6 +85,10 @@ class TestTokenBucket:
         bucket = TokenBucket(capacity=10, refill_rate=1.0)
         assert bucket._tokens == 10
 
+    def test_has_no_instance_dict(self):
+        bucket = TokenBucket(capacity=10, refill_rate=1.0)
+        assert not hasattr(bucket, "__dict__")
+
     async def test_acquire_consumes_token(self):
         bucket = TokenBucket(capacity=10, refill_rate=1.0)
         wait = await bucket.acquire()
@@ -82,17 +96,16 @@ class TestTokenBucket:
         assert bucket._tokens == 9.0
 
     @patch("arcllm.modules.rate_limit.asyncio.sleep", new_callable=AsyncMock)
-    @patch("arcllm.modules.rate_limit.time.monotonic")
+    @patch("arcllm.modules.rate_limit.time.monotonic_ns")
     async def test_acquire_when_empty_waits(self, mock_mono, mock_sleep):
-        t = 1000.0
+        t = 1_000_000_000_000
         mock_mono.return_value = t
         bucket = TokenBucket(capacity=1, refill_rate=1.0)
 
         # Consume the only token
         await bucket.acquire()
 
-        # First refill inside lock sees no elapsed time (still t=1000).
-        # After sleep, the re-acquire refill advances by 1s → token available.
+        # Refill sees no elapsed time (still t=1000s) → must reserve and wait.
         mock_mono.side_effect = _freeze_then_advance(t)
         wait = await bucket.acquire()
         assert wait > 0
@@ -103,9 +116,9 @@ class TestTokenBucket:
         wait = await bucket.acquire()
         assert wait == 0.0
 
-    @patch("arcllm.modules.rate_limit.time.monotonic")
+    @patch("arcllm.modules.rate_limit.time.monotonic_ns")
     async def test_refill_adds_tokens_over_time(self, mock_mono):
-        mock_mono.return_value = 1000.0
+        mock_mono.return_value = 1_000_000_000_000
         bucket = TokenBucket(capacity=10, refill_rate=2.0)
         # Consume all tokens
         for _ in range(10):
@@ -113,19 +126,29 @@ class TestTokenBucket:
         assert bucket._tokens == 0.0
 
         # Advance time by 3 seconds → should refill 6 tokens (2/sec * 3s)
-        mock_mono.return_value = 1003.0
+        mock_mono.return_value = 1_003_000_000_000
         bucket._refill()
         assert bucket._tokens == 6.0
 
-    @patch("arcllm.modules.rate_limit.time.monotonic")
+    @patch("arcllm.modules.rate_limit.time.monotonic_ns")
     async def test_refill_capped_at_capacity(self, mock_mono):
-        mock_mono.return_value = 1000.0
+        mock_mono.return_value = 1_000_000_000_000
         bucket = TokenBucket(capacity=5, refill_rate=10.0)
 
         # Advance time by 100 seconds → would refill 1000 tokens, but capped at 5
-        mock_mono.return_value = 1100.0
+        mock_mono.return_value = 1_100_000_000_000
+        bucket._refill()
+        assert bucket._tokens == 5
+
+    @patch("arcllm.modules.rate_limit.time.monotonic_ns")
+    async def test_refill_when_full_only_advances_clock(self, mock_mono):
+        mock_mono.return_value = 1_000_000_000_000
+        bucket = TokenBucket(capacity=5, refill_rate=1.0)
+
+        mock_mono.return_value = 1_010_000_000_000
         bucket._refill()
         assert bucket._tokens == 5
+        assert bucket._last_refill_ns == 1_010_000_000_000
 
     async def test_burst_allows_multiple_immediate(self):
         bucket = TokenBucket(capacity=5, refill_rate=1.0)
@@ -136,9 +159,9 @@ class TestTokenBucket:
         assert all(w == 0.0 for w in waits)
 
     @patch("arcllm.modules.rate_limit.asyncio.sleep", new_callable=AsyncMock)
-    @patch("arcllm.modules.rate_limit.time.monotonic")
+    @patch("arcllm.modules.rate_limit.time.monotonic_ns")
     async def test_burst_exhausted_then_waits(self, mock_mono, mock_sleep):
-        t = 1000.0
+        t = 1_000_000_000_000
         mock_mono.return_value = t
 
         bucket = TokenBucket(capacity=2, refill_rate=1.0)
@@ -152,6 +175,21 @@ class TestTokenBucket:
         assert wait > 0
         mock_sleep.assert_awaited_once()
 
+    @patch("arcllm.modules.rate_limit.time.monotonic_ns")
+    async def test_cancelled_waiter_returns_reservation(self, mock_mono):
+        mock_mono.return_value = 1_000_000_000_000
+        bucket = TokenBucket(capacity=1, refill_rate=0.001)
+        await bucket.acquire()
+
+        waiter = asyncio.ensure_future(bucket.acquire())
+        await asyncio.sleep(0)  # Let it reserve and start sleeping
+        assert bucket._tokens == -1.0
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert bucket._tokens == 0.0
+
 
 # ---------------------------------------------------------------------------
 # TestRateLimitModule
@@ -176,11 +214,11 @@ class TestRateLimitModule:
         inner.invoke.assert_awaited_once_with(messages, tools, max_tokens=100)
 
     @patch("arcllm.modules.rate_limit.asyncio.sleep", new_callable=AsyncMock)
-    @patch("arcllm.modules.rate_limit.time.monotonic")
+    @patch("arcllm.modules.rate_limit.time.monotonic_ns")
     async def test_logs_warning_when_throttled(
         self, mock_mono, mock_sleep, messages, caplog
     ):
-        t = 1000.0
+        t = 1_000_000_000_000
         mock_mono.return_value = t
         inner = _make_inner("anthropic")
         config = {"requests_per_minute": 60, "burst_capacity": 1}
@@ -259,6 +297,12 @@ class TestBucketRegistry:
         m2 = RateLimitModule(config, inner2)
         assert m1._bucket is m2._bucket
 
+    def test_same_provider_different_limits_shares_bucket(self):
+        m1 = RateLimitModule({"requests_per_minute": 60}, _make_inner("anthropic"))
+        m2 = RateLimitModule({"requests_per_minute": 120}, _make_inner("anthropic"))
+        assert m1._bucket is m2._bucket
+        assert m2._bucket._capacity == 60
+
     def test_different_providers_different_buckets(self):
         inner1 = _make_inner("anthropic")
         inner2 = _make_inner("openai")
@@ -282,15 +326,15 @@ class TestBucketRegistry:
 
 
 class TestConcurrentAccess:
-    async def test_concurrent_acquires_never_go_negative(self):
-        """Multiple concurrent acquires must never allow tokens below 0."""
+    async def test_concurrent_acquires_reserve_in_order(self):
+        """Concurrent waiters reserve successive tokens instead of racing."""
         bucket = TokenBucket(capacity=3, refill_rate=100.0)
         # Drain all tokens first
         for _ in range(3):
             await bucket.acquire()
 
-        # Launch 5 concurrent acquires — only 1-2 tokens will refill quickly.
-        # The loop-based acquire should re-check and wait, never going negative.
+        # Launch 5 concurrent acquires — each reserves the next token, so
+        # waits grow with queue position (FIFO) rather than re-polling.
         results = await asyncio.gather(
             bucket.acquire(),
             bucket.acquire(),
@@ -298,7 +342,9 @@ class TestConcurrentAccess:
             bucket.acquire(),
             bucket.acquire(),
         )
-        # All should return (some waited, some didn't), tokens must be >= 0
-        assert bucket._tokens >= 0.0
         assert len(results) == 5
         assert all(isinstance(w, float) for w in results)
+        assert results == sorted(results)
+        # Once every wait has elapsed, all reservations are repaid
+        bucket._refill()
+        assert bucket._tokens >= 0.0
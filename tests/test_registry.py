@@ -1,5 +1,6 @@
 """Tests for ArcLLM provider registry and load_model()."""
 
+import os
 import types as stdlib_types
 from unittest.mock import patch
 
@@ -15,11 +16,13 @@ from arcllm.types import LLMProvider
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture(autouse=True)
-def _set_api_keys(monkeypatch):
-    """Set fake API keys for adapter construction."""
-    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-anthropic-key")
-    monkeypatch.setenv("OPENAI_API_KEY", "test-openai-key")
+@pytest.fixture(scope="module", autouse=True)
+def _set_api_keys():
+    """Set fake API keys for adapter construction, once for the module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("ANTHROPIC_API_KEY", "test-anthropic-key")
+        mp.setenv("OPENAI_API_KEY", "test-openai-key")
+        yield
 
 
 @pytest.fixture(autouse=True)
@@ -135,6 +138,22 @@ class TestConfigCaching:
             # Each provider loaded once
             assert mock_load.call_count == 2
 
+    def test_config_cache_is_bounded(self):
+        from arcllm.registry import _load_config_cached
+
+        assert _load_config_cached.cache_info().maxsize == 32
+
+    def test_global_config_loaded_once(self):
+        from arcllm.config import load_global_config
+        from arcllm.registry import load_model
+
+        with patch(
+            "arcllm.registry.load_global_config", wraps=load_global_config
+        ) as mock_load:
+            load_model("anthropic")
+            load_model("openai", retry=True)
+        assert mock_load.call_count == 1
+
     def test_adapter_class_cached(self):
         """Adapter class is cached — importlib only called once per provider."""
         from arcllm.registry import _adapter_class_cache, load_model
@@ -146,6 +165,31 @@ class TestConfigCaching:
         # Still just one entry — class was reused from cache
         assert len(_adapter_class_cache) == 1
 
+    def test_adapter_class_first_cached_entry_wins(self):
+        """A class cached by a concurrent loader is returned, not overwritten."""
+        from arcllm.registry import _adapter_class_cache, _get_adapter_class
+
+        class _Winner:
+            pass
+
+        def _racing_load(name):
+            _adapter_class_cache[name] = _Winner
+            return object
+
+        with patch("arcllm.registry._load_adapter_class", side_effect=_racing_load):
+            assert _get_adapter_class("anthropic") is _Winner
+        assert _adapter_class_cache["anthropic"] is _Winner
+
+    def test_loaded_adapter_module_skips_import_machinery(self):
+        """After clear_cache(), an already-imported adapter is read from sys.modules."""
+        from arcllm.registry import _get_adapter_class, clear_cache
+
+        adapter_class = _get_adapter_class("anthropic")
+        clear_cache()
+        with patch("importlib.import_module") as mock_import:
+            assert _get_adapter_class("anthropic") is adapter_class
+        mock_import.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # TestErrorHandling
@@ -301,6 +345,16 @@ class TestModuleStacking:
         model = load_model("anthropic")
         assert isinstance(model, AnthropicAdapter)
 
+    def test_load_model_no_modules_skips_module_resolution(self):
+        """With nothing enabled, load_model never resolves module configs."""
+        from arcllm.adapters.anthropic import AnthropicAdapter
+        from arcllm.registry import load_model
+
+        with patch("arcllm.registry._resolve_module_config") as mock_resolve:
+            model = load_model("anthropic")
+        assert isinstance(model, AnthropicAdapter)
+        mock_resolve.assert_not_called()
+
     def test_load_model_retry_kwarg_overrides_config_values(self):
         """retry={max_retries: 10} overrides config.toml max_retries=2."""
         from arcllm.config import GlobalConfig, ModuleConfig
@@ -583,3 +637,14 @@ class TestModuleStacking:
         assert "anthropic" in _bucket_registry
         clear_cache()
         assert len(_bucket_registry) == 0
+
+    def test_clear_cache_drops_shared_signers(self):
+        """clear_cache() releases HMAC signers for retired signing keys."""
+        from arcllm import _signing
+        from arcllm.registry import clear_cache
+
+        with patch.dict(os.environ, {"ROTATED_KEY": "old-secret"}):
+            _signing.create_signer("hmac-sha256", "ROTATED_KEY")
+        assert _signing._hmac_signers
+        clear_cache()
+        assert _signing._hmac_signers == {}
@@ -1,14 +1,15 @@
 """Tests for RetryModule — exponential backoff with jitter."""
 
 import logging
-from unittest.mock import AsyncMock, MagicMock, patch
+from dataclasses import dataclass
+from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
 
 from arcllm.exceptions import ArcLLMAPIError, ArcLLMConfigError
 from arcllm.modules.retry import RetryModule
-from arcllm.types import LLMProvider, LLMResponse, Message, Usage
+from arcllm.types import LLMResponse, Message, Usage
 
 _OK_RESPONSE = LLMResponse(
     content="ok",
@@ -18,14 +19,21 @@ _OK_RESPONSE = LLMResponse(
 )
 
 
-def _make_inner(side_effects):
-    """Create a mock inner provider with specified side effects."""
-    inner = MagicMock(spec=LLMProvider)
-    inner.name = "test-provider"
-    inner.model_name = "test-model"
-    inner.validate_config.return_value = True
-    inner.invoke = AsyncMock(side_effect=side_effects)
-    return inner
+@dataclass
+class _FakeProvider:
+    """Plain stand-in for an LLMProvider; only ``invoke`` is a mock."""
+
+    invoke: AsyncMock
+    name: str = "test-provider"
+    model_name: str = "test-model"
+
+    def validate_config(self) -> bool:
+        return True
+
+
+def _make_inner(side_effects) -> _FakeProvider:
+    """Create a fake inner provider with specified side effects."""
+    return _FakeProvider(invoke=AsyncMock(side_effect=side_effects))
 
 
 def _api_error(status_code: int) -> ArcLLMAPIError:
@@ -183,7 +191,7 @@ class TestRetryBackoff:
         inner = _make_inner([_api_error(429)] * 3 + [_OK_RESPONSE])
         module = RetryModule(config, inner)
 
-        with patch("arcllm.modules.retry.random.uniform", return_value=0.0):
+        with patch("arcllm.modules.retry._rand", return_value=0.0):
             await module.invoke(messages)
 
         # Attempts: base*2^0=1, base*2^1=2, base*2^2=4 (jitter=0)
@@ -201,7 +209,7 @@ class TestRetryBackoff:
         inner = _make_inner([_api_error(500)] * 3 + [_OK_RESPONSE])
         module = RetryModule(config, inner)
 
-        with patch("arcllm.modules.retry.random.uniform", return_value=0.0):
+        with patch("arcllm.modules.retry._rand", return_value=0.0):
             await module.invoke(messages)
 
         waits = [call.args[0] for call in mock_sleep.await_args_list]
@@ -210,7 +218,7 @@ class TestRetryBackoff:
 
     @patch("arcllm.modules.retry.asyncio.sleep", new_callable=AsyncMock)
     async def test_jitter_proportional_to_backoff(self, mock_sleep, messages):
-        """Jitter is uniform(0, backoff) — proportional, not fixed."""
+        """Jitter is backoff * random() — proportional, not fixed."""
         config = {
             "max_retries": 2,
             "backoff_base_seconds": 1.0,
@@ -221,13 +229,34 @@ class TestRetryBackoff:
         module = RetryModule(config, inner)
 
         # Return 50% of the backoff as jitter each time
-        with patch("arcllm.modules.retry.random.uniform", return_value=0.5):
+        with patch("arcllm.modules.retry._rand", return_value=0.5):
             await module.invoke(messages)
 
         waits = [call.args[0] for call in mock_sleep.await_args_list]
-        # attempt 0: backoff=1.0, uniform called with (0, 1.0) returning 0.5 → 1.0+0.5=1.5
-        # attempt 1: backoff=2.0, uniform called with (0, 2.0) returning 0.5 → 2.0+0.5=2.5
-        assert waits == [1.5, 2.5]
+        # attempt 0: backoff=1.0, jitter=1.0*0.5 → 1.0+0.5=1.5
+        # attempt 1: backoff=2.0, jitter=2.0*0.5 → 2.0+1.0=3.0
+        assert waits == [1.5, 3.0]
+
+    def test_schedule_precomputed_at_init(self):
+        config = {
+            "max_retries": 4,
+            "backoff_base_seconds": 1.0,
+            "max_wait_seconds": 5.0,
+        }
+        module = RetryModule(config, _make_inner([]))
+        assert module._schedule == (1.0, 2.0, 4.0, 5.0)
+
+    def test_schedule_shared_across_instances(self):
+        config = {"max_retries": 3, "backoff_base_seconds": 0.5}
+        first = RetryModule(config, _make_inner([]))
+        second = RetryModule(dict(config), _make_inner([]))
+        assert first._schedule is second._schedule
+
+    def test_schedule_large_max_retries_does_not_overflow(self):
+        config = {"max_retries": 2000, "max_wait_seconds": 60.0}
+        module = RetryModule(config, _make_inner([]))
+        assert len(module._schedule) == 2000
+        assert module._schedule[-1] == 60.0
 
 
 # ---------------------------------------------------------------------------
@@ -270,6 +299,43 @@ class TestRetryConfig:
         result = await module2.invoke(messages)
         assert result.content == "ok"
 
+    async def test_out_of_table_status_code_retryable(self, messages):
+        config = {"backoff_base_seconds": 0.01, "retryable_status_codes": [999]}
+        inner = _make_inner([_api_error(999), _OK_RESPONSE])
+        module = RetryModule(config, inner)
+        result = await module.invoke(messages)
+        assert result.content == "ok"
+        assert inner.invoke.await_count == 2
+
+    async def test_config_list_mutation_does_not_change_retries(self, messages):
+        codes = [503]
+        config = {"backoff_base_seconds": 0.01, "retryable_status_codes": codes}
+        inner = _make_inner([_api_error(429), _OK_RESPONSE])
+        module = RetryModule(config, inner)
+        codes.append(429)
+
+        with pytest.raises(ArcLLMAPIError, match="429"):
+            await module.invoke(messages)
+        assert inner.invoke.await_count == 1
+
+    def test_retry_codes_frozen_at_init(self):
+        codes = [503]
+        module = RetryModule({"retryable_status_codes": codes}, _make_inner([]))
+        codes.append(429)
+        assert module._retryable_codes == frozenset({503})
+        assert not module._is_retryable_status(429)
+        assert module._is_retryable_status(503)
+
+    def test_module_has_no_instance_dict(self):
+        module = RetryModule({}, _make_inner([]))
+        assert not hasattr(module, "__dict__")
+
+    def test_status_predicate_shared_across_modules(self):
+        config = {"retryable_status_codes": [503, 429]}
+        first = RetryModule(config, _make_inner([]))
+        second = RetryModule({"retryable_status_codes": [429, 503]}, _make_inner([]))
+        assert first._is_retryable_status is second._is_retryable_status
+
 
 # ---------------------------------------------------------------------------
 # TestRetryValidation
@@ -297,6 +363,12 @@ class TestRetryValidation:
         with pytest.raises(ArcLLMConfigError, match="max_wait_seconds must be > 0"):
             RetryModule({"max_wait_seconds": 0}, inner)
 
+    @pytest.mark.parametrize("code", ["429", 429.0, True])
+    def test_non_int_status_code_rejected(self, code):
+        inner = _make_inner([_OK_RESPONSE])
+        with pytest.raises(ArcLLMConfigError, match="retryable_status_codes"):
+            RetryModule({"retryable_status_codes": [500, code]}, inner)
+
     def test_zero_max_retries_allowed(self):
         """max_retries=0 means 1 attempt only (no retries)."""
         inner = _make_inner([_OK_RESPONSE])
@@ -359,7 +431,7 @@ class TestRetryAfterHeader:
         )
         inner = _make_inner([error, _OK_RESPONSE])
         module = RetryModule(config, inner)
-        with patch("arcllm.modules.retry.random.uniform", return_value=0.0):
+        with patch("arcllm.modules.retry._rand", return_value=0.0):
             await module.invoke(messages)
         # backoff = 1.0 * 2^0 = 1.0, jitter = 0.0
         mock_sleep.assert_awaited_once_with(1.0)
@@ -392,3 +464,13 @@ class TestRetryLogging:
         with caplog.at_level(logging.WARNING, logger="arcllm.modules.retry"):
             await module.invoke(messages)
         assert caplog.text == ""
+
+    async def test_no_retry_log_when_warning_disabled(
+        self, messages, default_config, caplog
+    ):
+        inner = _make_inner([_api_error(429), _OK_RESPONSE])
+        module = RetryModule(default_config, inner)
+        with caplog.at_level(logging.ERROR, logger="arcllm.modules.retry"):
+            with patch("arcllm.modules.retry.logger.warning") as mock_warning:
+                await module.invoke(messages)
+        mock_warning.assert_not_called()
@@ -1,12 +1,18 @@
 """Tests for SecurityModule — PII redaction + request signing integration."""
 
+import asyncio
 import os
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from arcllm._pii import PiiDetector, PiiMatch, RegexPiiDetector
+from arcllm._pii import (
+    HyperscanPiiDetector,
+    PiiDetector,
+    PiiMatch,
+    RegexPiiDetector,
+)
 from arcllm.exceptions import ArcLLMConfigError
 from arcllm.modules.security import SecurityModule
 from arcllm.types import (
@@ -181,6 +187,65 @@ class TestPiiOutboundContentBlocks:
         assert "123-45-6789" not in str(block.arguments)
         assert "[PII:SSN]" in str(block.arguments)
 
+    async def test_redacts_nested_tool_use_args_in_place(self):
+        """Nested strings and numeric leaves are scanned; types are kept."""
+        inner = _make_inner()
+        module = SecurityModule(_base_config(), inner)
+        arguments = {
+            "filters": [{"email": "user@test.com"}, {"note": 'say "hi"\n'}],
+            "phone": 5551234567,
+            "limit": 10,
+            "exact": True,
+            "score": None,
+        }
+        messages = [
+            Message(
+                role="assistant",
+                content=[ToolUseBlock(id="tu1", name="search", arguments=arguments)],
+            )
+        ]
+
+        await module.invoke(messages)
+
+        sent = inner.invoke.call_args[0][0]
+        assert sent[0].content[0].arguments == {
+            "filters": [{"email": "[PII:EMAIL]"}, {"note": 'say "hi"\n'}],
+            "phone": "[PII:PHONE]",
+            "limit": 10,
+            "exact": True,
+            "score": None,
+        }
+
+    async def test_redacts_tuple_tool_use_args(self):
+        inner = _make_inner()
+        module = SecurityModule(_base_config(), inner)
+        arguments = {"ssns": ("123-45-6789", "none"), "pair": ("a", "b")}
+        messages = [
+            Message(
+                role="assistant",
+                content=[ToolUseBlock(id="tu1", name="lookup", arguments=arguments)],
+            )
+        ]
+
+        await module.invoke(messages)
+
+        sent = inner.invoke.call_args[0][0]
+        assert sent[0].content[0].arguments == {
+            "ssns": ["[PII:SSN]", "none"],
+            "pair": ("a", "b"),
+        }
+
+    async def test_clean_tool_use_block_passes_through(self):
+        inner = _make_inner()
+        module = SecurityModule(_base_config(), inner)
+        block = ToolUseBlock(
+            id="tu1", name="search", arguments={"q": ["weather"], "n": 3}
+        )
+
+        await module.invoke([Message(role="assistant", content=[block])])
+
+        assert inner.invoke.call_args[0][0][0].content[0] is block
+
     async def test_redacts_pii_from_tool_result_block_with_list_content(self):
         """ToolResultBlock with list[ContentBlock] content should pass through."""
         inner = _make_inner()
@@ -224,6 +289,23 @@ class TestPiiOutboundContentBlocks:
         # Image block should pass through unchanged
         assert sent[0].content[0].source == "base64data"
 
+    async def test_redacts_text_block_subclass(self):
+        """Block subclasses are redacted like their base type."""
+
+        class TaggedTextBlock(TextBlock):
+            tag: str = "note"
+
+        inner = _make_inner()
+        module = SecurityModule(_base_config(), inner)
+        messages = [
+            Message(role="user", content=[TaggedTextBlock(text="SSN 123-45-6789")])
+        ]
+
+        await module.invoke(messages)
+
+        sent = inner.invoke.call_args[0][0]
+        assert sent[0].content[0].text == "SSN [PII:SSN]"
+
 
 # ---------------------------------------------------------------------------
 # PII redaction — inbound response
@@ -290,7 +372,7 @@ class TestSigning:
 
         sig = result.metadata["request_signature"]
         assert len(sig) == 64
-        assert all(c in "0123456789abcdef" for c in sig)
+        assert bytes.fromhex(sig).hex() == sig  # lowercase hex only
 
     async def test_signature_deterministic(self):
         inner = _make_inner()
@@ -302,6 +384,78 @@ class TestSigning:
 
         assert r1.metadata["request_signature"] == r2.metadata["request_signature"]
 
+    async def test_signs_off_the_event_loop(self):
+        import threading
+
+        inner = _make_inner()
+        module = SecurityModule(_base_config(), inner)
+        sign = module._signer.sign
+        threads: list[int] = []
+
+        def _recording_sign(payload: bytes) -> str:
+            threads.append(threading.get_ident())
+            return sign(payload)
+
+        with patch.object(module._signer, "sign", _recording_sign):
+            await module.invoke([Message(role="user", content="hello")])
+
+        assert threads and threads[0] != threading.get_ident()
+
+    async def test_sign_requests_matches_invoke_signatures(self):
+        inner = _make_inner()
+        module = SecurityModule(_base_config(), inner)
+        first = [Message(role="user", content="SSN 123-45-6789")]
+        second = [Message(role="user", content="hello")]
+        tools = [Tool(name="search", description="Search", parameters={})]
+
+        signatures = module.sign_requests([(first, None), (second, tools)])
+
+        expected = [
+            (await module.invoke(first)).metadata["request_signature"],
+            (await module.invoke(second, tools)).metadata["request_signature"],
+        ]
+        assert signatures == expected
+
+    def test_sign_requests_requires_signing(self):
+        module = SecurityModule(_base_config(signing_enabled=False), _make_inner())
+        with pytest.raises(ArcLLMConfigError, match="signing_enabled"):
+            module.sign_requests([([Message(role="user", content="hi")], None)])
+
+    async def test_inner_error_propagates_unwrapped(self):
+        inner = _make_inner()
+        inner.invoke.side_effect = ArcLLMConfigError("boom")
+        module = SecurityModule(_base_config(), inner)
+
+        with pytest.raises(ArcLLMConfigError, match="boom"):
+            await module.invoke([Message(role="user", content="hello")])
+
+    async def test_inbound_redaction_error_releases_sign_task(self):
+        inner = _make_inner()
+        module = SecurityModule(_base_config(), inner)
+        ensure_future = asyncio.ensure_future
+        tasks: list[asyncio.Future[Any]] = []
+
+        def _capture(coro: Any) -> asyncio.Future[Any]:
+            task = ensure_future(coro)
+            tasks.append(task)
+            return task
+
+        with (
+            patch("arcllm.modules.security._discard_result") as mock_discard,
+            patch("arcllm.modules.security.asyncio.ensure_future", _capture),
+            patch.object(
+                module, "_redact_response", side_effect=ArcLLMConfigError("slow")
+            ),
+            pytest.raises(ArcLLMConfigError, match="slow"),
+        ):
+            await module.invoke([Message(role="user", content="hello")])
+
+        # The signing task gets the discard callback instead of being orphaned;
+        # done callbacks run before wait() returns.
+        (task,) = tasks
+        await asyncio.wait([task])
+        mock_discard.assert_called_once_with(task)
+
 
 # ---------------------------------------------------------------------------
 # Combined PII + signing
@@ -450,6 +604,46 @@ class TestConfigValidation:
                     _make_inner(),
                 )
 
+    def test_match_timeout_propagated(self):
+        pytest.importorskip("regex")
+        with patch.dict(os.environ, {"TEST_SIGNING_KEY": "key"}):
+            module = SecurityModule(
+                _base_config(pii_match_timeout=0.5),
+                _make_inner(),
+            )
+        assert module._pii_detector._match_timeout == 0.5
+
+    def test_hyperscan_detector_selected(self):
+        pytest.importorskip("hyperscan")
+        with patch.dict(os.environ, {"TEST_SIGNING_KEY": "key"}):
+            module = SecurityModule(
+                _base_config(pii_detector="hyperscan"),
+                _make_inner(),
+            )
+        assert isinstance(module._pii_detector, HyperscanPiiDetector)
+
+    def test_custom_pattern_with_inline_flags_accepted(self):
+        with patch.dict(os.environ, {"TEST_SIGNING_KEY": "key"}):
+            module = SecurityModule(
+                _base_config(
+                    pii_custom_patterns=[
+                        {"name": "SECRET", "pattern": r"(?i)secret-\d+"}
+                    ]
+                ),
+                _make_inner(),
+            )
+        assert module._redact_str("SECRET-42") == "[PII:SECRET]"
+
+    def test_custom_pattern_with_backreference_rejected(self):
+        with patch.dict(os.environ, {"TEST_SIGNING_KEY": "key"}):
+            with pytest.raises(ArcLLMConfigError, match="group by number"):
+                SecurityModule(
+                    _base_config(
+                        pii_custom_patterns=[{"name": "R", "pattern": r"(\d)\1"}]
+                    ),
+                    _make_inner(),
+                )
+
     def test_unknown_config_keys_raises(self):
         with patch.dict(os.environ, {"TEST_SIGNING_KEY": "key"}):
             with pytest.raises(ArcLLMConfigError, match="Unknown SecurityModule"):
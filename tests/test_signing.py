@@ -1,13 +1,20 @@
 """Tests for request signing — HMAC and canonical serialization."""
 
+import hashlib
+import hmac
 import os
 from unittest.mock import patch
 
 import pytest
 
-from arcllm._signing import HmacSigner, canonical_payload, create_signer
+from arcllm._signing import (
+    HmacSigner,
+    canonical_payload,
+    clear_signer_cache,
+    create_signer,
+)
 from arcllm.exceptions import ArcLLMConfigError
-from arcllm.types import Message, Tool
+from arcllm.types import Message, TextBlock, Tool
 
 
 # ---------------------------------------------------------------------------
@@ -40,7 +47,41 @@ class TestHmacSigner:
         sig = signer.sign(b"payload")
         # SHA-256 hex digest is 64 characters
         assert len(sig) == 64
-        assert all(c in "0123456789abcdef" for c in sig)
+        assert bytes.fromhex(sig).hex() == sig  # lowercase hex only
+
+    def test_sign_batch_matches_sign(self):
+        signer = HmacSigner(key=b"test-secret")
+        payloads = [b"", b"one", b"two" * 100]
+        assert signer.sign_batch(payloads) == [signer.sign(p) for p in payloads]
+
+    def test_sign_batch_empty(self):
+        assert HmacSigner(key=b"test-secret").sign_batch([]) == []
+
+    def test_sign_bytes_is_raw_digest(self):
+        signer = HmacSigner(key=b"test-secret")
+        assert signer.sign_bytes(b"payload").hex() == signer.sign(b"payload")
+
+    def test_verify_accepts_own_signature(self):
+        signer = HmacSigner(key=b"test-secret")
+        assert signer.verify(b"payload", signer.sign(b"payload"))
+        # Hex case does not matter once decoded to raw bytes.
+        assert signer.verify(b"payload", signer.sign(b"payload").upper())
+
+    @pytest.mark.parametrize("signature", ["", "zz", "00" * 32])
+    def test_verify_rejects_bad_signature(self, signature):
+        assert not HmacSigner(key=b"test-secret").verify(b"payload", signature)
+
+    def test_verify_rejects_other_payload(self):
+        signer = HmacSigner(key=b"test-secret")
+        assert not signer.verify(b"other", signer.sign(b"payload"))
+
+    @pytest.mark.parametrize(
+        "key", [b"", b"test-secret", b"k" * 64, b"k" * 65, bytes(range(200))]
+    )
+    def test_matches_stdlib_hmac(self, key):
+        payload = b'{"messages":[],"model":"m","tools":[]}'
+        expected = hmac.new(key, payload, hashlib.sha256).hexdigest()
+        assert HmacSigner(key=key).sign(payload) == expected
 
 
 # ---------------------------------------------------------------------------
@@ -77,6 +118,33 @@ class TestCanonicalPayload:
         payload_str = payload.decode("utf-8")
         assert '"tools":[]' in payload_str
 
+    def test_canonical_form_is_stdlib_json(self):
+        """Floats and non-ASCII text keep the stdlib json spelling."""
+        msgs = [Message(role="user", content="caf\u00e9")]
+        tools = [Tool(name="t", description="d", parameters={"x": 1e16})]
+        result = canonical_payload(msgs, tools, "model-a")
+        assert b"caf\\u00e9" in result
+        assert b'"x":1e+16' in result
+
+    def test_matches_model_dump_serialization(self):
+        import json
+
+        msgs = [
+            Message(role="system", content="be brief"),
+            Message(role="user", content=[TextBlock(text="hi")]),
+        ]
+        tools = [Tool(name="t", description="d", parameters={"b": 1, "a": [2]})]
+        expected = json.dumps(
+            {
+                "messages": [m.model_dump() for m in msgs],
+                "model": "model-a",
+                "tools": [t.model_dump() for t in tools],
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        assert canonical_payload(msgs, tools, "model-a") == expected
+
     def test_returns_bytes(self):
         messages = [Message(role="user", content="test")]
         payload = canonical_payload(messages, None, "model")
@@ -100,6 +168,52 @@ class TestCreateSigner:
             signer = create_signer("hmac-sha256", "TEST_SIGNING_KEY")
         assert isinstance(signer, HmacSigner)
 
+    def test_hmac_signer_shared_per_key(self):
+        with patch.dict(os.environ, {"K1": "secret", "K2": "secret", "K3": "other"}):
+            first = create_signer("hmac-sha256", "K1")
+            assert create_signer("hmac-sha256", "K2") is first
+            assert create_signer("hmac-sha256", "K3") is not first
+
+    def test_shared_signers_keyed_by_key_hash(self):
+        from arcllm import _signing
+
+        clear_signer_cache()
+        with patch.dict(os.environ, {"K1": "secret"}):
+            signer = create_signer("hmac-sha256", "K1")
+        assert _signing._hmac_signers == {hashlib.sha256(b"secret").digest(): signer}
+
+    def test_shared_signer_cache_bounded_and_clearable(self):
+        from arcllm import _signing
+
+        clear_signer_cache()
+        size = _signing._HMAC_SIGNER_CACHE_SIZE
+        for i in range(size + 3):
+            with patch.dict(os.environ, {"K": f"key-{i}"}):
+                create_signer("hmac-sha256", "K")
+        assert len(_signing._hmac_signers) == size
+        # Oldest keys were evicted first
+        assert hashlib.sha256(b"key-0").digest() not in _signing._hmac_signers
+
+        clear_signer_cache()
+        assert _signing._hmac_signers == {}
+
+    def test_shared_signer_cache_evicts_least_recently_used(self):
+        from arcllm import _signing
+
+        clear_signer_cache()
+        size = _signing._HMAC_SIGNER_CACHE_SIZE
+        for i in range(size):
+            with patch.dict(os.environ, {"K": f"key-{i}"}):
+                create_signer("hmac-sha256", "K")
+        with patch.dict(os.environ, {"K": "key-0"}):
+            create_signer("hmac-sha256", "K")
+        with patch.dict(os.environ, {"K": "key-new"}):
+            create_signer("hmac-sha256", "K")
+
+        assert hashlib.sha256(b"key-0").digest() in _signing._hmac_signers
+        assert hashlib.sha256(b"key-1").digest() not in _signing._hmac_signers
+        clear_signer_cache()
+
     def test_missing_signing_key_env(self):
         with patch.dict(os.environ, {}, clear=True):
             with pytest.raises(ArcLLMConfigError, match="not set"):
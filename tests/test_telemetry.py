@@ -1,13 +1,16 @@
 """Tests for TelemetryModule — structured logging of timing, tokens, and cost."""
 
 import logging
+from contextlib import nullcontext
+from dataclasses import dataclass
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from opentelemetry import trace
 
 from arcllm.exceptions import ArcLLMConfigError
 from arcllm.modules.telemetry import TelemetryModule
-from arcllm.types import LLMProvider, LLMResponse, Message, Usage
+from arcllm.types import LLMResponse, Message, Usage
 
 _OK_RESPONSE = LLMResponse(
     content="ok",
@@ -37,13 +40,20 @@ _ZERO_TOKEN_RESPONSE = LLMResponse(
 )
 
 
-def _make_inner(name: str = "test-provider") -> MagicMock:
-    inner = MagicMock(spec=LLMProvider)
-    inner.name = name
-    inner.model_name = "test-model"
-    inner.validate_config.return_value = True
-    inner.invoke = AsyncMock(return_value=_OK_RESPONSE)
-    return inner
+@dataclass
+class _FakeProvider:
+    """Plain stand-in for an LLMProvider; only ``invoke`` is a mock."""
+
+    invoke: AsyncMock
+    name: str = "test-provider"
+    model_name: str = "test-model"
+
+    def validate_config(self) -> bool:
+        return True
+
+
+def _make_inner(name: str = "test-provider") -> _FakeProvider:
+    return _FakeProvider(invoke=AsyncMock(return_value=_OK_RESPONSE), name=name)
 
 
 def _make_config(**overrides) -> dict:
@@ -83,7 +93,7 @@ class TestTelemetryModule:
         await module.invoke(messages, tools=tools, max_tokens=100)
         inner.invoke.assert_awaited_once_with(messages, tools, max_tokens=100)
 
-    @patch("arcllm.modules.telemetry.time.monotonic")
+    @patch("arcllm.modules.telemetry.monotonic")
     async def test_logs_timing_and_usage(self, mock_mono, messages, caplog):
         mock_mono.side_effect = [1000.0, 1000.5]  # 500ms elapsed
         inner = _make_inner("anthropic")
@@ -100,7 +110,7 @@ class TestTelemetryModule:
         assert "total_tokens=150" in caplog.text
         assert "stop_reason=end_turn" in caplog.text
 
-    @patch("arcllm.modules.telemetry.time.monotonic")
+    @patch("arcllm.modules.telemetry.monotonic")
     async def test_logs_cost_calculation(self, mock_mono, messages, caplog):
         """Verify cost = (100 * 3.00 / 1e6) + (50 * 15.00 / 1e6) = 0.001050."""
         mock_mono.side_effect = [1000.0, 1000.1]
@@ -112,7 +122,7 @@ class TestTelemetryModule:
 
         assert "cost_usd=0.001050" in caplog.text
 
-    @patch("arcllm.modules.telemetry.time.monotonic")
+    @patch("arcllm.modules.telemetry.monotonic")
     async def test_logs_cache_tokens_when_present(self, mock_mono, messages, caplog):
         mock_mono.side_effect = [1000.0, 1000.1]
         inner = _make_inner()
@@ -125,7 +135,7 @@ class TestTelemetryModule:
         assert "cache_read_tokens=80" in caplog.text
         assert "cache_write_tokens=20" in caplog.text
 
-    @patch("arcllm.modules.telemetry.time.monotonic")
+    @patch("arcllm.modules.telemetry.monotonic")
     async def test_no_cache_fields_when_absent(self, mock_mono, messages, caplog):
         mock_mono.side_effect = [1000.0, 1000.1]
         inner = _make_inner()
@@ -138,7 +148,7 @@ class TestTelemetryModule:
         assert "cache_read_tokens" not in caplog.text
         assert "cache_write_tokens" not in caplog.text
 
-    @patch("arcllm.modules.telemetry.time.monotonic")
+    @patch("arcllm.modules.telemetry.monotonic")
     async def test_cost_includes_cache_tokens(self, mock_mono, messages, caplog):
         """Cost should include cache read and write costs.
 
@@ -159,7 +169,7 @@ class TestTelemetryModule:
 
         assert "cost_usd=0.001149" in caplog.text
 
-    @patch("arcllm.modules.telemetry.time.monotonic")
+    @patch("arcllm.modules.telemetry.monotonic")
     async def test_cost_zero_when_zero_tokens(self, mock_mono, messages, caplog):
         mock_mono.side_effect = [1000.0, 1000.1]
         inner = _make_inner()
@@ -171,7 +181,55 @@ class TestTelemetryModule:
 
         assert "cost_usd=0.000000" in caplog.text
 
-    @patch("arcllm.modules.telemetry.time.monotonic")
+    @patch("arcllm.modules.telemetry.monotonic")
+    async def test_unpriced_skips_arithmetic(self, mock_mono, messages, caplog):
+        mock_mono.side_effect = [1000.0, 1000.1]
+        module = TelemetryModule({}, _make_inner())
+
+        with (
+            patch.object(TelemetryModule, "_calculate_cost") as mock_cost,
+            caplog.at_level(logging.INFO, logger="arcllm.modules.telemetry"),
+        ):
+            await module.invoke(messages)
+
+        mock_cost.assert_not_called()
+        assert "cost_usd=0.000000" in caplog.text
+
+    @patch("arcllm.modules.telemetry.monotonic")
+    async def test_skips_work_when_disabled(self, mock_mono, messages, caplog):
+        mock_mono.side_effect = [1000.0, 1000.1]
+        module = TelemetryModule(_make_config(log_level="DEBUG"), _make_inner())
+
+        with (
+            patch.object(
+                module, "_span", return_value=nullcontext(trace.INVALID_SPAN)
+            ),
+            patch.object(TelemetryModule, "_calculate_cost") as mock_cost,
+            caplog.at_level(logging.INFO, logger="arcllm.modules.telemetry"),
+        ):
+            result = await module.invoke(messages)
+
+        assert result is _OK_RESPONSE
+        mock_cost.assert_not_called()
+        assert caplog.text == ""
+
+    @patch("arcllm.modules.telemetry.monotonic")
+    async def test_recording_span_gets_cost_when_log_disabled(
+        self, mock_mono, messages, caplog, fake_tracer
+    ):
+        mock_mono.side_effect = [1000.0, 1000.1]
+        module = TelemetryModule(_make_config(log_level="DEBUG"), _make_inner())
+
+        with caplog.at_level(logging.INFO, logger="arcllm.modules.telemetry"):
+            await module.invoke(messages)
+
+        assert caplog.text == ""
+        span = fake_tracer.by_name["arcllm.telemetry"][0]
+        span.set_attribute.assert_any_call(
+            "arcllm.telemetry.cost_usd", pytest.approx(0.00105)
+        )
+
+    @patch("arcllm.modules.telemetry.monotonic")
     async def test_custom_log_level(self, mock_mono, messages, caplog):
         mock_mono.side_effect = [1000.0, 1000.1]
         inner = _make_inner()
@@ -199,7 +257,7 @@ class TestTelemetryModule:
         module = TelemetryModule(_make_config(), inner)
         assert module.model_name == "test-model"
 
-    @patch("arcllm.modules.telemetry.time.monotonic")
+    @patch("arcllm.modules.telemetry.monotonic")
     async def test_returns_response_unchanged(self, mock_mono, messages):
         mock_mono.side_effect = [1000.0, 1000.1]
         inner = _make_inner()
@@ -326,7 +384,7 @@ class TestTelemetryValidationExtended:
         with pytest.raises(ValueError, match="provider exploded"):
             await module.invoke(messages)
 
-    @patch("arcllm.modules.telemetry.time.monotonic")
+    @patch("arcllm.modules.telemetry.monotonic")
     async def test_cache_tokens_zero_logged_not_omitted(self, mock_mono, messages, caplog):
         """cache_read_tokens=0 (not None) should appear in log, unlike None which is omitted."""
         mock_mono.side_effect = [1000.0, 1000.1]
@@ -353,7 +411,7 @@ class TestTelemetryValidationExtended:
         assert "cache_read_tokens=0" in caplog.text
         assert "cache_write_tokens=0" in caplog.text
 
-    @patch("arcllm.modules.telemetry.time.monotonic")
+    @patch("arcllm.modules.telemetry.monotonic")
     async def test_model_name_sanitized_in_log(self, mock_mono, messages, caplog):
         """Model names with newlines are escaped to prevent log injection."""
         mock_mono.side_effect = [1000.0, 1000.1]
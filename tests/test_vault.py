@@ -7,7 +7,7 @@ from unittest.mock import patch
 import pytest
 
 from arcllm.exceptions import ArcLLMConfigError
-from arcllm.vault import VaultBackend, VaultResolver
+from arcllm.vault import VaultBackend, VaultResolver, _CacheEntry
 
 
 # ---------------------------------------------------------------------------
@@ -163,6 +163,47 @@ class TestVaultCache:
         # Backend called twice (cache expired between calls)
         assert len(backend.get_secret_calls) == 2
 
+    @patch("arcllm.vault.time.monotonic_ns")
+    def test_stale_read_never_evicts_fresh_entry(self, mock_ns):
+        backend = MockVaultBackend(secrets={"path": "key"})
+        resolver = VaultResolver(backend=backend, cache_ttl_seconds=1)
+        mock_ns.return_value = 0
+        resolver._set_cached("path", "old")
+        stale = resolver._cache["path"]
+        mock_ns.return_value = 2_000_000_000
+
+        def _store_fresh():
+            # Another thread stores a fresh value right after the stale check
+            resolver._cache["path"] = _CacheEntry("new", 3_000_000_000)
+            return 2_000_000_000
+
+        mock_ns.side_effect = _store_fresh
+        assert resolver._get_cached("path") is None
+        mock_ns.side_effect = None
+        assert resolver._cache["path"] is not stale
+        assert resolver._get_cached("path") == "new"
+
+    def test_zero_ttl_stores_nothing(self):
+        backend = MockVaultBackend(secrets={"path": "key"})
+        resolver = VaultResolver(backend=backend, cache_ttl_seconds=0)
+        with patch.dict(os.environ, {"K": "env"}):
+            resolver.resolve_api_key("K", "path")
+        assert resolver._cache == {}
+
+    @patch("arcllm.vault.time.monotonic_ns")
+    def test_entry_valid_until_ttl_elapses(self, mock_ns):
+        backend = MockVaultBackend(secrets={"path": "key"})
+        resolver = VaultResolver(backend=backend, cache_ttl_seconds=60)
+        with patch.dict(os.environ, {"K": "env"}):
+            mock_ns.return_value = 0
+            resolver.resolve_api_key("K", "path")
+            mock_ns.return_value = 60_000_000_000
+            resolver.resolve_api_key("K", "path")
+            assert len(backend.get_secret_calls) == 1
+            mock_ns.return_value = 60_000_000_001
+            resolver.resolve_api_key("K", "path")
+        assert len(backend.get_secret_calls) == 2
+
 
 # ---------------------------------------------------------------------------
 # VaultResolver — error cases